@@ -5,29 +5,16 @@
 翻译工具主入口 - 命令行界面
 """
 
-import os
 import sys
-import signal
 import argparse
+from pathlib import Path
 
-from translator import logger
+from translator import logger, log_banner
 from translator.processor import Processor
 from translator.terminology_manager import TerminologyManager
 from translator.translator import Translator
 
 
-def signal_handler(sig, frame):
-    """
-    处理中断信号(Ctrl+C)
-
-    Args:
-        sig: 信号编号
-        frame: 当前栈帧
-    """
-    print("\n程序已终止")
-    sys.exit(0)
-
-
 def parse_args():
     """解析命令行参数"""
     parser = argparse.ArgumentParser(
@@ -78,15 +65,16 @@ def parse_args():
 
 def main():
     """主函数"""
-    # 注册信号处理函数
-    signal.signal(signal.SIGINT, signal_handler)
+    # 输出启动信息
+    log_banner()
 
     # 解析命令行参数
     args = parse_args()
 
-    # 处理输入参数
-    input_path = os.path.abspath(args.input_path)
-    output_path = os.path.abspath(args.output_path) if args.output_path else None
+    # 处理输入参数（只stat一次，后续复用判断结果）
+    input_path = Path(args.input_path).resolve()
+    output_path = Path(args.output_path).resolve() if args.output_path else None
+    input_is_file = input_path.is_file()
 
     # 初始化处理器
     terminology_manager = TerminologyManager(args.terminology_file)
@@ -94,9 +82,7 @@ def main():
     translator = Translator(terminology_manager)
 
     processor = Processor(
-        input_dir=(
-            os.path.dirname(input_path) if os.path.isfile(input_path) else input_path
-        ),
+        input_dir=input_path.parent if input_is_file else input_path,
         output_dir=output_path,
         terminology_manager=terminology_manager,
         translator=translator,
@@ -109,7 +95,7 @@ def main():
             processor.extract_terminology(input_path)
         else:
             logger.info("运行翻译模式")
-            if os.path.isfile(input_path):
+            if input_is_file:
                 logger.info(f"处理文件: {input_path}")
                 processor.translate_file(input_path)
             else:
@@ -118,8 +104,9 @@ def main():
 
         logger.info("操作完成!")
     except KeyboardInterrupt:
-        # 捕获Ctrl+C，但不做任何处理，让signal_handler处理
-        pass
+        # Ctrl+C：默认的SIGINT处理会抛出KeyboardInterrupt，在这里统一退出
+        print("\n程序已终止")
+        sys.exit(130)
     except Exception as e:
         logger.error(f"处理过程中发生错误: {e}")
         sys.exit(1)
@@ -10,18 +10,24 @@ from .config import config, logger
 __version__ = "1.0.0"
 __author__ = "Translator Agent Team"
 
-import os
-import sys
-import platform
 
-logger.info("=" * 80)
-logger.info(f"翻译工具初始化 v{__version__}")
-logger.info(f"Python版本: {sys.version}")
-logger.info(f"操作系统: {platform.platform()}")
-logger.info(f"工作目录: {os.getcwd()}")
-logger.info(f"API密钥是否设置: {'是' if config.api_key else '否'}")
-logger.info(f"API基础URL: {config.api_base}")
-logger.info(f"使用的chat模型: {config.chat_model_name}")
-logger.info(f"使用的reasoner模型: {config.reasoner_model_name}")
-logger.info(f"最大令牌数: {config.max_tokens}")
-logger.info("=" * 80)
+def log_banner():
+    """输出启动信息
+
+    只在命令行入口调用，单纯import包时不再产生日志和platform子进程开销。
+    """
+    import os
+    import sys
+    import platform
+
+    logger.info("=" * 80)
+    logger.info("翻译工具初始化 v%s", __version__)
+    logger.info("Python版本: %s", sys.version)
+    logger.info("操作系统: %s", platform.platform())
+    logger.info("工作目录: %s", os.getcwd())
+    logger.info("API密钥是否设置: %s", '是' if config.api_key else '否')
+    logger.info("API基础URL: %s", config.api_base)
+    logger.info("使用的chat模型: %s", config.chat_model_name)
+    logger.info("使用的reasoner模型: %s", config.reasoner_model_name)
+    logger.info("最大令牌数: %s", config.max_tokens)
+    logger.info("=" * 80)
@@ -5,38 +5,181 @@
 API模块 - 封装所有与外部API的交互
 """
 
+import asyncio
+import functools
+import logging
+import os
 import re
 import time
+import httpx
 import openai
 from typing import List, Dict
 from .config import config, logger
+from .cache import ApiCache, create_api_cache
+
+# 术语行格式"英文:中文"，预编译多行正则，整段响应一次findall扫完
+_TERM_RE = re.compile(r"^\s*([^:\n]+?)\s*:\s*(.+?)\s*$", re.M)
+
+# 批量翻译时标记各段落的编号，响应按相同标记拆回各段
+_SEGMENT_RE = re.compile(r"<段落\s*(\d+)>\n?")
+
+# 提示词的静态部分在模块加载时准备好，每次调用只拼接变量槽位；
+# 静态前缀保持逐字节一致也让服务端的前缀缓存命中率最高
+_TRANSLATE_PROMPT_PARTS = (
+    """
+            <角色>你是一位专业的计算机书籍翻译专家
+            <任务>将以下英文内容准确翻译为中文
+            <要求>
+            保持原文技术准确性的同时使用自然流畅的中文表达
+            严格使用术语对照表
+            技术公式/代码示例保持原文，仅翻译注释部分
+            处理长难句时适当拆分但保持逻辑完整
+            根据英文内容直接翻译，维持原有的格式，不省略任何信息。
+            保留原文的Markdown格式
+
+            <翻译前的原文>
+            """,
+    """
+            <专有名词>
+            """,
+    """
+            """,
+)
+
+_POLISH_PROMPT_PARTS = (
+    """
+你是一名擅长将英文计算机技术书籍翻译为流畅中文表达的翻译员，能够理解英文的俚语、深层次意思，也同样可以用通顺、地道的中文表达。请将一个已有的翻译进行润色
+
+要求：
+使用用尽可能地道的简体中文表达
+严格遵循术语表译法
+信达雅
+中文表达专业流畅，无翻译腔
+拆分嵌套从句（比如英文长句改为中文流水句）
+消除翻译腔（比如减少被字句、“进行”式表达）
+技术隐喻本土化\n专业表达校准（如区分验证、校验等技术动词）
+原文Markdown格式完整保留
+
+输出：只输出翻译结果文字，不需要输出改动说明、修改建议等
+
+<原文>
+""",
+    """
+
+<初步翻译>
+""",
+    """
+
+<专有名词>
+""",
+    """
+
+        """,
+)
 
 
 class ApiClient:
     """API客户端，封装与DeepSeek API的交互"""
 
+    # 超时和重试设置
+    TIMEOUT = 180.0  # 秒
+    MAX_RETRIES = 3
+
+    # 类级共享的OpenAI客户端（连接池），所有实例复用同一组TCP+TLS连接
+    _shared_client = None
+    _shared_aclient = None
+
+    @classmethod
+    def _get_client(cls) -> openai.OpenAI:
+        """返回类级共享的同步客户端，首次调用时创建"""
+        if cls._shared_client is None:
+            cls._shared_client = openai.OpenAI(
+                api_key=config.api_key or "",
+                base_url=config.api_base,
+                timeout=cls.TIMEOUT,
+                max_retries=cls.MAX_RETRIES,
+                http_client=httpx.Client(
+                    http2=True, limits=cls._http_limits(), timeout=cls.TIMEOUT
+                ),
+            )
+        return cls._shared_client
+
+    @classmethod
+    def _get_aclient(cls) -> openai.AsyncOpenAI:
+        """返回类级共享的异步客户端，首次调用时创建"""
+        if cls._shared_aclient is None:
+            cls._shared_aclient = openai.AsyncOpenAI(
+                api_key=config.api_key or "",
+                base_url=config.api_base,
+                timeout=cls.TIMEOUT,
+                max_retries=cls.MAX_RETRIES,
+                http_client=httpx.AsyncClient(
+                    http2=True, limits=cls._http_limits(), timeout=cls.TIMEOUT
+                ),
+            )
+        return cls._shared_aclient
+
+    @staticmethod
+    def _http_limits() -> httpx.Limits:
+        """HTTP/2连接池配置，多个并发请求复用同一条TLS连接"""
+        return httpx.Limits(max_connections=32, max_keepalive_connections=32)
+
+    @classmethod
+    def close_clients(cls) -> None:
+        """关闭共享客户端并重置，供需要干净拆除的场景使用
+
+        须在事件循环之外调用；异步客户端的关闭需要事件循环，
+        在协程中拆除请改用aclose_clients。
+        """
+        if cls._shared_client is not None:
+            cls._shared_client.close()
+            cls._shared_client = None
+        if cls._shared_aclient is not None:
+            aclient = cls._shared_aclient
+            cls._shared_aclient = None
+            asyncio.run(aclient.close())
+
+    @classmethod
+    async def aclose_clients(cls) -> None:
+        """异步关闭共享客户端并重置，供事件循环内的拆除路径使用"""
+        if cls._shared_client is not None:
+            cls._shared_client.close()
+            cls._shared_client = None
+        if cls._shared_aclient is not None:
+            aclient = cls._shared_aclient
+            cls._shared_aclient = None
+            await aclient.close()
+
     def __init__(self):
         """初始化API客户端"""
-        import openai
-
-        # 配置超时和重试设置
-        self.timeout = 180.0  # 秒
-        self.max_retries = 3
+        self.timeout = self.TIMEOUT
+        self.max_retries = self.MAX_RETRIES
 
         # 记录超时和重试设置
-        logger.info(f"配置API请求超时: {self.timeout}秒")
-        logger.info(f"配置API最大重试次数: {self.max_retries}")
+        logger.info("配置API请求超时: %s秒", self.timeout)
+        logger.info("配置API最大重试次数: %s", self.max_retries)
+
+        # 批量翻译的并发上限
+        self.concurrency = int(os.getenv("TRANSLATE_CONCURRENCY", "8"))
+        logger.info("配置批量翻译并发数: %s", self.concurrency)
 
-        # 初始化API密钥和基础URL
-        logger.info(f"API密钥是否设置: {'是' if config.api_key else '否'}")
-        logger.info(f"API基础URL: {config.api_base}")
+        # API响应缓存，相同请求直接返回缓存结果，不再重复调用LLM
+        self.cache = create_api_cache()
 
-        # 配置API基础URL
-        if config.api_base:
-            openai.base_url = config.api_base
-            logger.info(f"设置OpenAI API基础URL: {config.api_base}")
+    @property
+    def client(self) -> openai.OpenAI:
+        """类级共享的同步客户端
+
+        首次真正发起调用时才构建：缺少API密钥时SDK构造即抛错，
+        延迟到调用点让"仅导入/查看帮助"的路径保持可用，
+        与配置校验只告警不中断的行为一致。
+        """
+        return self._get_client()
 
-        openai.api_key = config.api_key
+    @property
+    def aclient(self) -> openai.AsyncOpenAI:
+        """类级共享的异步客户端，同样在首次调用时才构建"""
+        return self._get_aclient()
 
     def extract_terms(self, text: str, system_prompt: str) -> List[Dict[str, str]]:
         """
@@ -58,12 +201,12 @@ class ApiClient:
             )
             return self._extract_terms(response_text)
         except Exception as e:
-            logger.warning(f"术语提取失败: {str(e)}")
+            logger.warning("术语提取失败: %s", str(e))
             return []
 
     def _extract_terms(self, text: str) -> List[Dict[str, str]]:
         """
-        使用正则表达式从响应中提取术语
+        从响应中逐行提取术语
 
         Args:
             text: 响应文本
@@ -73,25 +216,50 @@ class ApiClient:
         Returns:
             提取的术语列表
         """
-        logger.info(f"提取术语:{text}")
-        terms = []
-
-        # 匹配 英文:中文 模式
-        # 英文术语可以包含空格、数字、字母和连字符
-        pattern = r"([^\s:]+.*?)\s*:\s*([^\n]+)"  # 确保英文术语非空
-        matches = re.findall(pattern, text)
-
-        if matches:
-            logger.info(f"通过正则表达式找到 {len(matches)} 个术语")
-            for english, chinese in matches:
-                if english.strip():  # 确保英文术语不为空
-                    terms.append(
-                        {"english": english.strip(), "chinese": chinese.strip()}
-                    )
-            return terms
+        logger.info("提取术语:%s", text)
+
+        # 整段响应单次findall，匹配和strip都在C层完成
+        terms = [
+            {"english": english, "chinese": chinese}
+            for english, chinese in _TERM_RE.findall(text)
+        ]
+
+        if terms:
+            logger.info("找到 %s 个术语", len(terms))
         else:
-            logger.warning("无法通过正则表达式提取术语")
-            return []
+            logger.warning("无法从响应中提取术语")
+        return terms
+
+    def _build_translate_prompt(self, text: str, terminology: str) -> str:
+        """
+        构建翻译的系统提示词
+
+        Args:
+            text: 待翻译的文本
+            terminology: 术语表字符串
+
+        Returns:
+            系统提示词
+        """
+        head, mid, tail = _TRANSLATE_PROMPT_PARTS
+        return "".join((head, text, mid, terminology, tail))
+
+    def _build_polish_prompt(
+        self, original: str, translation: str, terminology: str
+    ) -> str:
+        """
+        构建润色的用户提示词
+
+        Args:
+            original: 原文
+            translation: 初步翻译
+            terminology: 术语表字符串
+
+        Returns:
+            用户提示词
+        """
+        head, mid1, mid2, tail = _POLISH_PROMPT_PARTS
+        return "".join((head, original, mid1, translation, mid2, terminology, tail))
 
     def translate_text(self, text: str, terminology: str) -> str:
         """
@@ -100,7 +268,6 @@ class ApiClient:
         Args:
             text: 待翻译的文本
             terminology: 术语表字符串
-            system_prompt: 系统提示词
 
         Returns:
             翻译后的文本
@@ -108,22 +275,7 @@ class ApiClient:
         logger.info("调用翻译API")
 
         # 系统提示词
-        system_prompt = f"""
-            <角色>你是一位专业的计算机书籍翻译专家
-            <任务>将以下英文内容准确翻译为中文
-            <要求>
-            保持原文技术准确性的同时使用自然流畅的中文表达
-            严格使用术语对照表
-            技术公式/代码示例保持原文，仅翻译注释部分
-            处理长难句时适当拆分但保持逻辑完整
-            根据英文内容直接翻译，维持原有的格式，不省略任何信息。
-            保留原文的Markdown格式
-
-            <翻译前的原文>
-            {text}
-            <专有名词>
-            {terminology}
-            """
+        system_prompt = self._build_translate_prompt(text, terminology)
         try:
             return self._call_api(
                 config.chat_model_name,
@@ -132,10 +284,73 @@ class ApiClient:
                 temperature=1.3,
             )
         except Exception as e:
-            logger.error(f"调用翻译API时出错: {str(e)}")
+            logger.error("调用翻译API时出错: %s", str(e))
             # 如果翻译失败，返回原文
             return text
 
+    def translate_texts(self, texts: List[str], terminology: str) -> List[str]:
+        """
+        将多段文本合并为一次请求翻译
+
+        每段用<段落 N>标记包裹后拼成一个提示词，单次请求摊薄
+        每请求的网络与提示词开销；响应按相同标记拆回各段译文，
+        解析不到的段落回退为原文。
+
+        Args:
+            texts: 待翻译的文本列表
+            terminology: 术语表字符串
+
+        Returns:
+            翻译后的文本列表，顺序与输入一致
+        """
+        if not texts:
+            return []
+        if len(texts) == 1:
+            return [self.translate_text(texts[0], terminology)]
+
+        logger.info("调用批量翻译API，共 %s 段", len(texts))
+
+        combined = "以下内容分为多个段落，每段以<段落 N>标记开头；请逐段翻译，并在输出中原样保留每段开头的<段落 N>标记。\n\n"
+        combined += "\n\n".join(
+            f"<段落 {i}>\n{text}" for i, text in enumerate(texts, 1)
+        )
+
+        system_prompt = self._build_translate_prompt(combined, terminology)
+        try:
+            response = self._call_api(
+                config.chat_model_name,
+                system_prompt=system_prompt,
+                user_prompt="",
+                temperature=1.3,
+            )
+        except Exception as e:
+            logger.error("调用批量翻译API时出错: %s", str(e))
+            # 如果翻译失败，返回各段原文
+            return list(texts)
+
+        return self._split_numbered(response, texts)
+
+    @staticmethod
+    def _split_numbered(response: str, fallback: List[str]) -> List[str]:
+        """
+        按<段落 N>标记把响应拆回各段
+
+        Args:
+            response: 批量翻译的完整响应
+            fallback: 解析不到对应段落时使用的回退文本列表
+
+        Returns:
+            各段译文列表，长度与fallback一致
+        """
+        results = list(fallback)
+        parts = _SEGMENT_RE.split(response)
+        # split结果形如 [前导文本, 编号, 段文本, 编号, 段文本, ...]
+        for i in range(1, len(parts) - 1, 2):
+            index = int(parts[i]) - 1
+            if 0 <= index < len(results):
+                results[index] = parts[i + 1].strip()
+        return results
+
     def polish_translation(
         self, original: str, translation: str, terminology: str
     ) -> str:
@@ -150,42 +365,119 @@ class ApiClient:
         Returns:
             润色后的翻译
         """
-        user_prompt = f"""
-你是一名擅长将英文计算机技术书籍翻译为流畅中文表达的翻译员，能够理解英文的俚语、深层次意思，也同样可以用通顺、地道的中文表达。请将一个已有的翻译进行润色
+        user_prompt = self._build_polish_prompt(original, translation, terminology)
 
-要求：
-使用用尽可能地道的简体中文表达
-严格遵循术语表译法
-信达雅
-中文表达专业流畅，无翻译腔
-拆分嵌套从句（比如英文长句改为中文流水句）
-消除翻译腔（比如减少被字句、“进行”式表达）
-技术隐喻本土化\n专业表达校准（如区分验证、校验等技术动词）
-原文Markdown格式完整保留
+        try:
+            return self._call_api(
+                model_name=config.reasoner_model_name,
+                system_prompt="",
+                user_prompt=user_prompt,
+            )
+        except Exception as e:
+            logger.error("调用翻译润色API时出错: %s", str(e))
+            return translation
 
-输出：只输出翻译结果文字，不需要输出改动说明、修改建议等
+    async def translate_text_async(self, text: str, terminology: str) -> str:
+        """
+        异步调用API翻译文本
 
-<原文>
-{original}
+        Args:
+            text: 待翻译的文本
+            terminology: 术语表字符串
 
-<初步翻译>
-{translation}
+        Returns:
+            翻译后的文本
+        """
+        logger.info("调用翻译API")
 
-<专有名词>
-{terminology}
+        system_prompt = self._build_translate_prompt(text, terminology)
+        try:
+            return await self._acall_api(
+                config.chat_model_name,
+                system_prompt=system_prompt,
+                user_prompt="",
+                temperature=1.3,
+            )
+        except Exception as e:
+            logger.error("调用翻译API时出错: %s", str(e))
+            # 如果翻译失败，返回原文
+            return text
 
+    async def polish_translation_async(
+        self, original: str, translation: str, terminology: str
+    ) -> str:
+        """
+        异步润色翻译
+
+        Args:
+            original: 原文
+            translation: 初步翻译
+            terminology: 术语表字符串
+
+        Returns:
+            润色后的翻译
         """
+        user_prompt = self._build_polish_prompt(original, translation, terminology)
 
         try:
-            return self._call_api(
+            return await self._acall_api(
                 model_name=config.reasoner_model_name,
                 system_prompt="",
                 user_prompt=user_prompt,
             )
         except Exception as e:
-            logger.error(f"调用翻译润色API时出错: {str(e)}")
+            logger.error("调用翻译润色API时出错: %s", str(e))
             return translation
 
+    async def extract_terms_async(
+        self, text: str, system_prompt: str
+    ) -> List[Dict[str, str]]:
+        """
+        异步提取文本中的术语及其翻译
+
+        Args:
+            text: 要提取术语的文本
+            system_prompt: 系统提示
+
+        Returns:
+            术语列表，每个术语包含英文和中文
+        """
+        logger.info("调用术语提取API")
+
+        try:
+            response_text = await self._acall_api(
+                config.chat_model_name, system_prompt, "", temperature=1.3
+            )
+            return self._extract_terms(response_text)
+        except Exception as e:
+            logger.warning("术语提取失败: %s", str(e))
+            return []
+
+    async def translate_batch(self, texts: List[str], terminology: str) -> List[str]:
+        """
+        批量翻译文本
+
+        每个文本内部仍按"翻译 -> 润色"串行执行，但多个文本之间并发处理，
+        并发数由环境变量TRANSLATE_CONCURRENCY控制（默认8）。
+
+        Args:
+            texts: 待翻译的文本列表
+            terminology: 术语表字符串
+
+        Returns:
+            润色后的翻译列表，顺序与输入一致
+        """
+        sem = asyncio.Semaphore(self.concurrency)
+
+        async def _one(text: str) -> str:
+            async with sem:
+                translation = await self.translate_text_async(text, terminology)
+                return await self.polish_translation_async(
+                    text, translation, terminology
+                )
+
+        return await asyncio.gather(*[_one(text) for text in texts])
+
     def _call_api(
         self,
         model_name: str,
@@ -205,26 +497,30 @@ class ApiClient:
         Returns:
             API响应文本
         """
-        try:
-            logger.info("准备调用API")
-            logger.info(f"模型: {model_name}")
-            logger.info(f"系统提示词: {system_prompt}")
-            logger.info(f"用户提示词: {user_prompt}")
-            logger.info(f"温度参数: {temperature}")
-            logger.info(f"最大Token数: {config.max_tokens}")
-
-            # 创建OpenAI客户端
-            client = openai.OpenAI(
-                api_key=config.api_key,
-                base_url=config.api_base,
-                timeout=self.timeout,
-                max_retries=3,
+        # 查询缓存，命中时跳过网络调用
+        cache_key = None
+        if self.cache is not None:
+            cache_key = ApiCache.make_key(
+                model_name, system_prompt, user_prompt, temperature
             )
-            logger.info("已配置API客户端")
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                logger.info("命中API响应缓存")
+                return cached
 
-            # 调用API
+        try:
+            logger.info("准备调用API")
+            logger.info("模型: %s", model_name)
+            # 提示词包含整段原文和术语表，只在DEBUG级别记录，避免热路径的大量I/O
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("系统提示词: %s", system_prompt)
+                logger.debug("用户提示词: %s", user_prompt)
+            logger.info("温度参数: %s", temperature)
+            logger.info("最大Token数: %s", config.max_tokens)
+
+            # 调用API（复用初始化时创建的客户端）
             start_time = time.time()
-            response = client.chat.completions.create(
+            response = self.client.chat.completions.create(
                 model=model_name,
                 messages=[
                     {"role": "system", "content": system_prompt},
@@ -236,27 +532,114 @@ class ApiClient:
             end_time = time.time()
 
             # 记录响应信息
-            logger.info(f"API调用完成，耗时: {end_time - start_time:.2f}秒")
-            logger.info(f"总令牌数: {response.usage.total_tokens}")
-            logger.info(f"响应: {response.choices[0].message.content}")
+            logger.info("API调用完成，耗时: %.2f秒", end_time - start_time)
+            logger.info("总令牌数: %s", response.usage.total_tokens)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应: %s", response.choices[0].message.content)
+
+            if cache_key is not None:
+                self.cache.set(cache_key, response.choices[0].message.content)
 
             return response.choices[0].message.content
         except Exception as e:
             error_message = str(e)
-            logger.error(f"API调用失败: {error_message}")
+            logger.error("API调用失败: %s", error_message)
 
             # 添加更详细的错误信息记录
             if hasattr(e, "response"):
                 try:
                     response_data = e.response.json()
-                    logger.error(f"详细响应: {response_data}")
-                    logger.error(f"HTTP状态码: {e.response.status_code}")
-                    logger.error(f"响应头: {dict(e.response.headers)}")
+                    logger.error("详细响应: %s", response_data)
+                    logger.error("HTTP状态码: %s", e.response.status_code)
+                    logger.error("响应头: %s", dict(e.response.headers))
                 except Exception as parse_error:
-                    logger.error(f"无法解析错误响应: {parse_error}")
+                    logger.error("无法解析错误响应: %s", parse_error)
 
             raise Exception(f"调用翻译API时出错: {error_message}")
 
+    async def _acall_api(
+        self,
+        model_name: str,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float = 0.3,
+    ) -> str:
+        """
+        异步调用API执行请求
+
+        Args:
+            model_name: 模型名称
+            system_prompt: 系统提示词
+            user_prompt: 用户提示词
+            temperature: 温度参数，控制随机性
+
+        Returns:
+            API响应文本
+        """
+        # 查询缓存，命中时跳过网络调用
+        cache_key = None
+        if self.cache is not None:
+            cache_key = ApiCache.make_key(
+                model_name, system_prompt, user_prompt, temperature
+            )
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                logger.info("命中API响应缓存")
+                return cached
+
+        try:
+            logger.info("准备调用API")
+            logger.info("模型: %s", model_name)
+            logger.info("温度参数: %s", temperature)
+            logger.info("最大Token数: %s", config.max_tokens)
+
+            # 调用API（复用初始化时创建的异步客户端）
+            # 流式接收：边生成边累积token，不等整个Completion构建完成，
+            # 也不在内存中保留完整的响应对象
+            start_time = time.time()
+            stream = await self.aclient.chat.completions.create(
+                model=model_name,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt},
+                ],
+                temperature=temperature,
+                max_tokens=config.max_tokens,
+                stream=True,
+            )
+            chunks = []
+            async for event in stream:
+                if event.choices:
+                    chunks.append(event.choices[0].delta.content or "")
+            end_time = time.time()
+
+            content = "".join(chunks)
+
+            # 记录响应信息
+            logger.info("API调用完成，耗时: %.2f秒", end_time - start_time)
+
+            if cache_key is not None:
+                self.cache.set(cache_key, content)
+
+            return content
+        except Exception as e:
+            error_message = str(e)
+            logger.error("API调用失败: %s", error_message)
+            raise Exception(f"调用翻译API时出错: {error_message}")
+
+
+@functools.lru_cache(maxsize=1)
+def get_api_client() -> ApiClient:
+    """返回全局API客户端单例（首次调用时才创建）"""
+    return ApiClient()
+
+
+def __getattr__(name: str):
+    """延迟创建全局api_client
 
-# 创建全局API客户端
-api_client = ApiClient()
+    只引用ApiClient类型（例如测试中自行实例化）时，import本模块
+    不再触发客户端构建及其连接池/缓存初始化。
+    """
+    if name == "api_client":
+        return get_api_client()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
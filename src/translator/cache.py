@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+缓存模块 - 基于SQLite的API响应磁盘缓存
+"""
+
+import os
+import hashlib
+import sqlite3
+import threading
+from typing import Optional
+
+from .config import logger
+
+
+class ApiCache:
+    """API响应缓存，按请求内容哈希持久化到磁盘
+
+    重复的段落（样板标题、重复示例、失败后重跑）不再重复调用LLM，
+    直接返回缓存的响应。
+    """
+
+    def __init__(self, cache_dir: str):
+        """
+        初始化缓存
+
+        Args:
+            cache_dir: 缓存目录路径，不存在时自动创建
+        """
+        os.makedirs(cache_dir, exist_ok=True)
+        self._conn = sqlite3.connect(
+            os.path.join(cache_dir, "api_cache.sqlite3"), check_same_thread=False
+        )
+        self._lock = threading.Lock()
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS kv (key BLOB PRIMARY KEY, val TEXT)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(
+        model_name: str, system_prompt: str, user_prompt: str, temperature: float
+    ) -> bytes:
+        """
+        根据请求参数生成缓存键
+
+        Args:
+            model_name: 模型名称
+            system_prompt: 系统提示词
+            user_prompt: 用户提示词
+            temperature: 温度参数
+
+        Returns:
+            16字节的blake2b摘要
+        """
+        raw = f"{model_name}\0{system_prompt}\0{user_prompt}\0{temperature}"
+        return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).digest()
+
+    def get(self, key: bytes) -> Optional[str]:
+        """
+        查询缓存
+
+        Args:
+            key: 缓存键
+
+        Returns:
+            缓存的响应文本，未命中时返回None
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT val FROM kv WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: bytes, value: str) -> None:
+        """
+        写入缓存
+
+        Args:
+            key: 缓存键
+            value: 响应文本
+        """
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO kv (key, val) VALUES (?, ?)", (key, value)
+            )
+            self._conn.commit()
+
+
+def create_api_cache() -> Optional[ApiCache]:
+    """
+    根据环境变量创建API响应缓存
+
+    环境变量:
+        TRANSLATE_CACHE: 设置为"0"时禁用缓存
+        TRANSLATE_CACHE_DIR: 缓存目录，默认".translator-cache"
+
+    Returns:
+        缓存对象，禁用或创建失败时返回None
+    """
+    if os.getenv("TRANSLATE_CACHE", "1") == "0":
+        logger.info("API响应缓存已禁用")
+        return None
+
+    cache_dir = os.getenv("TRANSLATE_CACHE_DIR", ".translator-cache")
+    try:
+        cache = ApiCache(cache_dir)
+        logger.info("API响应缓存目录: %s", cache_dir)
+        return cache
+    except Exception as e:
+        logger.warning("创建API响应缓存失败，缓存已禁用: %s", e)
+        return None
@@ -5,8 +5,11 @@
 配置管理模块 - 负责加载和管理翻译工具的配置
 """
 
+import atexit
 import os
+import queue
 import logging
+import logging.handlers
 from dotenv import load_dotenv
 
 # 加载环境变量
@@ -16,10 +19,34 @@ load_dotenv()
 # 日志配置
 def setup_logging():
     """设置日志记录"""
+    # 实际的文件/控制台输出由后台线程完成，调用方只需把日志记录放入队列，
+    # 避免热路径上的同步磁盘写入和锁竞争
+    formatter = logging.Formatter(
+        "%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s"
+    )
+    file_handler = logging.handlers.RotatingFileHandler(
+        "translator.log", maxBytes=10_000_000, backupCount=3
+    )
+    file_handler.setFormatter(formatter)
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(formatter)
+
+    log_queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(
+        log_queue, file_handler, stream_handler, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
+
+    # QueueHandler.prepare()入队前会先用handler自身的formatter把消息
+    # 烤进record.msg；给它恒等formatter，只合并参数不加前缀，
+    # 真正的格式化（含调用方的文件名/行号）留给监听线程的输出handler
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+
     logging.basicConfig(
-        level=logging.DEBUG,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s",
-        handlers=[logging.FileHandler("translator.log"), logging.StreamHandler()],
+        level=logging.INFO,
+        handlers=[queue_handler],
     )
 
     # 设置第三方库的日志级别
@@ -40,6 +67,15 @@ logger = setup_logging()
 class Config:
     """应用配置类"""
 
+    # 配置对象在每次API调用时被访问，固定槽位布局让属性读取更快
+    __slots__ = (
+        "api_key",
+        "api_base",
+        "chat_model_name",
+        "reasoner_model_name",
+        "max_tokens",
+    )
+
     def __init__(self):
         # API设置
         self.api_key = os.getenv("DEEPSEEK_API_KEY")
@@ -5,11 +5,11 @@
 数据模型模块 - 定义翻译工具使用的数据结构
 """
 
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class TranslationUnit:
     """
     翻译单元，表示要翻译的段落及其相关信息
@@ -23,9 +23,11 @@ class TranslationUnit:
     polished_translation: str = ""
     technical_terms: List[Tuple[str, str]] = field(default_factory=list)
     suggestions: str = ""
+    is_code: Optional[bool] = None  # 是否为代码块，None表示尚未判定
+    terminology_str: str = ""  # 相关术语的字符串形式，翻译阶段填充后各阶段复用
 
 
-@dataclass
+@dataclass(slots=True)
 class TranslationContext:
     """
     翻译上下文，包含翻译过程中需要的状态信息
@@ -53,7 +55,7 @@ class TranslationContext:
         self.total_units = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class TranslationResult:
     """
     翻译结果，包含整体翻译的结果信息
@@ -6,9 +6,11 @@
 """
 
 import os
-import concurrent.futures
+import time
+import asyncio
+import logging
 from tqdm import tqdm
-from typing import List, Dict, Tuple
+from typing import Dict, Iterator, List, Optional
 
 from .config import logger
 from .models import TranslationUnit, TranslationContext, TranslationResult
@@ -26,6 +28,7 @@ class Processor:
         output_dir: str,
         terminology_manager: TerminologyManager,
         translator: Translator,
+        max_workers: Optional[int] = None,
     ):
         """
         初始化处理器
@@ -35,6 +38,8 @@ class Processor:
             output_dir: 输出目录
             terminology_manager: 术语管理器
             translator: 翻译器
+            max_workers: 单元级并发数，不指定时取环境变量
+                TRANSLATE_CONCURRENCY（默认8）
         """
         self.input_dir = input_dir
         self.output_dir = output_dir
@@ -43,10 +48,28 @@ class Processor:
         self.translator = translator
         self.min_unit_length = 4000  # 最小单元长度阈值，小于此长度的单元可能会被合并
 
+        # 并发预算显式化：API是远程服务，合适的在途请求数
+        # 跟本机CPU核数无关，不依赖运行环境的默认值
+        if max_workers is None:
+            max_workers = int(os.getenv("TRANSLATE_CONCURRENCY", "8"))
+        self.max_workers = max_workers
+
     def translate_file(self, markdown_file: str) -> TranslationResult:
         """
         处理单个Markdown文件
 
+        Args:
+            markdown_file: Markdown文件路径
+
+        Returns:
+            处理结果
+        """
+        return asyncio.run(self._atranslate_file(markdown_file))
+
+    async def _atranslate_file(self, markdown_file: str) -> TranslationResult:
+        """
+        异步处理单个Markdown文件
+
         Args:
             markdown_file: Markdown文件路径
 
@@ -66,7 +89,6 @@ class Processor:
             # 提取翻译单元
             units = self._extract_translation_units(markdown_content)
             self.context.update_progress(total=len(units))
-            logger.info(f"提取了 {len(units)} 个翻译单元")
 
             # 初始化输出文件
             output_file = self._get_output_path(markdown_file)
@@ -76,7 +98,7 @@ class Processor:
             self._initialize_output_file(output_file)
 
             # 翻译每个单元，并在每个单元完成后保存结果
-            self._process_translation_units(units, output_file)
+            await self._aprocess_translation_units(units, output_file)
 
             # 清除当前处理状态
             self.context.clear()
@@ -100,13 +122,15 @@ class Processor:
         Returns:
             Markdown内容
         """
+        # 二进制方式整块读入后一次性解码，
+        # 避免文本模式逐段增量解码的开销，失败时也无需重新读文件
+        with open(file_path, "rb") as f:
+            data = f.read()
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                return f.read()
+            return data.decode("utf-8")
         except UnicodeDecodeError:
             # 尝试使用其他编码
-            with open(file_path, "r", encoding="latin-1") as f:
-                return f.read()
+            return data.decode("latin-1")
 
     def _initialize_output_file(self, output_file: str) -> None:
         """
@@ -132,58 +156,95 @@ class Processor:
             units: 翻译单元列表
             output_file: 输出文件路径
         """
-        # 存储翻译结果的字典，键为原始索引，值为翻译后的内容
-        results: Dict[int, str] = {}
-
-        # 定义处理单个翻译单元的函数
-        def process_unit(index: int, unit: TranslationUnit) -> Tuple[int, str]:
-            # 翻译当前单元
-            translated_unit = self.translator.translate_unit(unit)
-            # 返回索引和翻译结果
-            return index, translated_unit.polished_translation
-
-        # 使用线程池并行处理翻译任务
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            # 提交所有翻译任务到线程池
-            future_to_index = {
-                executor.submit(process_unit, i, unit): i
-                for i, unit in enumerate(units)
-            }
-
-            # 使用tqdm显示进度
-            for future in tqdm(
-                concurrent.futures.as_completed(future_to_index),
-                total=len(units),
-                desc="翻译进度",
-            ):
-                index, translation = future.result()
-                # 存储结果，保留原始索引
-                results[index] = translation
-                # 更新当前处理的单元索引（虽然是并行的，但仍然记录进度）
-                self.context.update_progress(index=index)
-                # 打印进度
-                completed = len(results)
-                progress = completed / len(units) * 100
-                logger.info(
-                    f"已完成 {completed}/{len(units)} 个翻译单元 ({progress:.1f}%)"
-                )
+        asyncio.run(self._aprocess_translation_units(units, output_file))
 
-        # 按原始顺序写入结果
-        for i in range(len(units)):
-            self._append_to_output_file(output_file, results[i])
-
-        logger.info("所有翻译单元处理完成，已按原始顺序写入结果文件。")
-
-    def _append_to_output_file(self, output_file: str, content: str) -> None:
+    async def _aprocess_translation_units(
+        self, units: List[TranslationUnit], output_file: str
+    ) -> None:
         """
-        追加内容到输出文件
+        以两级异步流水线并发处理翻译单元
+
+        翻译和润色两个阶段各有一组worker协程，通过有界队列衔接：
+        单元i的润色可以与单元i+1的翻译同时进行，保持API始终饱和。
+        结果按原始顺序流式写入输出文件，不在内存中保留整个文档。
 
         Args:
+            units: 翻译单元列表
             output_file: 输出文件路径
-            content: 要追加的内容
         """
-        with open(output_file, "a", encoding="utf-8") as f:
-            f.write(content + "\n\n")
+        # 乱序完成的结果先暂存在这里，等轮到自己时立即写出
+        pending: Dict[int, str] = {}
+        next_to_write = 0
+        completed = 0
+        last_log = time.monotonic()
+
+        # 每个阶段的worker数量
+        workers = self.max_workers
+
+        # 有界队列限制在途单元数，避免内存无限增长
+        queue_translate: asyncio.Queue = asyncio.Queue(maxsize=2 * workers)
+        queue_polish: asyncio.Queue = asyncio.Queue(maxsize=2 * workers)
+
+        progress_bar = tqdm(total=len(units), desc="翻译进度")
+
+        async def translate_worker():
+            while True:
+                item = await queue_translate.get()
+                if item is None:
+                    break
+                index, unit = item
+                await self.translator.translate_stage_async(unit)
+                await queue_polish.put((index, unit))
+
+        async def polish_worker(output):
+            nonlocal next_to_write, completed, last_log
+            while True:
+                item = await queue_polish.get()
+                if item is None:
+                    break
+                index, unit = item
+                await self.translator.polish_stage_async(unit)
+                # 暂存结果；轮到的部分立即按原始顺序写出
+                pending[index] = unit.polished_translation
+                while next_to_write in pending:
+                    output.write(pending.pop(next_to_write) + "\n\n")
+                    next_to_write += 1
+                # 更新当前处理的单元索引（虽然是并发的，但仍然记录进度）
+                self.context.update_progress(index=index)
+                progress_bar.update(1)
+                # 进度日志限流：人眼进度由tqdm负责，日志最多每秒一条，
+                # 完成时再补一条，避免单元多、延迟低时日志开销占比过高
+                completed += 1
+                now = time.monotonic()
+                if now - last_log > 1.0 or completed == len(units):
+                    last_log = now
+                    logger.info("已完成 %s/%s 个翻译单元", completed, len(units))
+
+        async def feed_and_close(translate_tasks):
+            # 投喂所有单元，然后逐级发送结束信号
+            for item in enumerate(units):
+                await queue_translate.put(item)
+            for _ in translate_tasks:
+                await queue_translate.put(None)
+            await asyncio.gather(*translate_tasks)
+            for _ in range(workers):
+                await queue_polish.put(None)
+
+        # 整个处理过程共用一个带1MiB缓冲的句柄，摊薄写系统调用
+        with open(output_file, "w", encoding="utf-8", buffering=1 << 20) as output:
+            try:
+                async with asyncio.TaskGroup() as task_group:
+                    translate_tasks = [
+                        task_group.create_task(translate_worker())
+                        for _ in range(workers)
+                    ]
+                    for _ in range(workers):
+                        task_group.create_task(polish_worker(output))
+                    task_group.create_task(feed_and_close(translate_tasks))
+            finally:
+                progress_bar.close()
+
+        logger.info("所有翻译单元处理完成，已按原始顺序写入结果文件。")
 
     def _get_output_path(self, input_file: str) -> str:
         """
@@ -209,9 +270,8 @@ class Processor:
         if not output_path.lower().endswith(".md"):
             output_path = os.path.splitext(output_path)[0] + ".md"
 
-        # 确保输出目录存在
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
-
+        # 纯字符串变换，不做任何系统调用；
+        # 输出目录由_initialize_output_file或目录模式的预创建保证
         return output_path
 
     def translate_directory(self) -> tuple:
@@ -236,6 +296,25 @@ class Processor:
 
         return success_count, failed_files
 
+    def _iter_markdown_files(self) -> Iterator[str]:
+        """
+        懒惰遍历输入目录下所有的Markdown文件
+
+        基于os.scandir递归遍历，目录项类型直接取自dirent，
+        不需要对每个文件额外stat；找到一个就产出一个。
+
+        Yields:
+            文件路径
+        """
+        stack = [self.input_dir]
+        while stack:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.lower().endswith(".md"):
+                        yield entry.path
+
     def _find_markdown_files(self) -> List[str]:
         """
         查找所有需要处理的Markdown文件
@@ -243,17 +322,7 @@ class Processor:
         Returns:
             文件路径列表
         """
-        markdown_files = []
-
-        # 遍历输入目录
-        for root, _, files in os.walk(self.input_dir):
-            for file in files:
-                # 只处理Markdown文件
-                if file.lower().endswith(".md"):
-                    file_path = os.path.join(root, file)
-                    markdown_files.append(file_path)
-
-        return markdown_files
+        return list(self._iter_markdown_files())
 
     def _translate_markdown_files(self, markdown_files: List[str]) -> tuple:
         """
@@ -265,30 +334,60 @@ class Processor:
         Returns:
             (成功处理的文件数, 失败的文件列表)
         """
-        success_count = 0
-        failed_files = []
+        return asyncio.run(self._atranslate_markdown_files(markdown_files))
 
-        for i, markdown_file in enumerate(markdown_files):
-            try:
-                logger.info(
-                    f"翻译文件 [{i + 1}/{len(markdown_files)}]: {markdown_file}"
-                )
+    async def _atranslate_markdown_files(self, markdown_files: List[str]) -> tuple:
+        """
+        并发翻译多个Markdown文件
 
-                # 翻译文件
-                result = self.translate_file(markdown_file)
+        每个文件的API调用都是网络密集型的，文件之间相互独立，
+        用信号量限制同时在途的文件数，其余文件排队等待。
 
-                if result.success:
-                    success_count += 1
-                else:
-                    failed_files.append((markdown_file, result.error_message))
-                    logger.error(f"翻译文件失败: {result.error_message}")
+        Args:
+            markdown_files: Markdown文件路径列表
 
-            except Exception as e:
-                failed_files.append((markdown_file, str(e)))
-                logger.error(f"翻译文件 {markdown_file} 时发生错误: {e}")
+        Returns:
+            (成功处理的文件数, 失败的文件列表)
+        """
+        # 预先一次性创建所有输出子目录，
+        # 热路径上不再对每个文件重复makedirs探测父目录
+        output_dirs = {
+            os.path.dirname(self._get_output_path(markdown_file))
+            for markdown_file in markdown_files
+        }
+        for output_dir in output_dirs:
+            os.makedirs(output_dir, exist_ok=True)
+
+        # 同时处理的文件数上限，总的API并发仍由连接池统一约束
+        file_workers = int(os.getenv("TRANSLATE_FILE_CONCURRENCY", "4"))
+        semaphore = asyncio.Semaphore(file_workers)
+
+        async def translate_one(index: int, markdown_file: str) -> TranslationResult:
+            async with semaphore:
+                logger.info(
+                    f"翻译文件 [{index + 1}/{len(markdown_files)}]: {markdown_file}"
+                )
+                return await self._atranslate_file(markdown_file)
+
+        results = await asyncio.gather(
+            *(
+                translate_one(i, markdown_file)
+                for i, markdown_file in enumerate(markdown_files)
+            ),
+            return_exceptions=True,
+        )
 
-                # 继续处理下一个文件
-                continue
+        success_count = 0
+        failed_files = []
+        for markdown_file, result in zip(markdown_files, results):
+            if isinstance(result, BaseException):
+                failed_files.append((markdown_file, str(result)))
+                logger.error(f"翻译文件 {markdown_file} 时发生错误: {result}")
+            elif result.success:
+                success_count += 1
+            else:
+                failed_files.append((markdown_file, result.error_message))
+                logger.error(f"翻译文件失败: {result.error_message}")
 
         return success_count, failed_files
 
@@ -318,11 +417,31 @@ class Processor:
         """
         术语抽取模式：从输入文件中提取术语并保存到术语表
         """
-        # 查找所有Markdown文件
+        asyncio.run(self._aextract_terminology(input_path))
+
+    async def _aextract_terminology(self, input_path: str) -> None:
+        """
+        异步术语抽取：单元之间并发调用提取API
+
+        每个单元一次LLM调用，纯网络密集型，单元之间没有依赖；
+        并发提取后术语表的合并在事件循环内串行完成。
+
+        Args:
+            input_path: 输入文件或目录路径
+        """
+        # 逐个产出Markdown文件，无需先收集完整列表
         markdown_files = (
-            self._find_markdown_files() if os.path.isdir(input_path) else [input_path]
+            self._iter_markdown_files() if os.path.isdir(input_path) else [input_path]
         )
 
+        semaphore = asyncio.Semaphore(self.max_workers)
+
+        async def extract_one(unit: TranslationUnit) -> None:
+            async with semaphore:
+                await self.terminology_manager.extract_terms_async(unit.original_text)
+            # 周期性检查点，长任务中途不丢已提取的成果
+            self.terminology_manager.flush_if_dirty()
+
         for markdown_file in markdown_files:
             logger.info(f"提取术语: {markdown_file}")
             try:
@@ -332,16 +451,18 @@ class Processor:
                 # 提取翻译单元
                 units = self._extract_translation_units(markdown_content)
 
-                # 提取术语
+                # 并发提取术语，跳过代码块
+                pending_units = []
                 for unit in units:
                     if is_code_block(unit):
                         logger.info(f"跳过代码块:{unit.original_text}")
                         continue
+                    pending_units.append(unit)
 
-                    self.terminology_manager.extract_terms(unit.original_text)
+                await asyncio.gather(*(extract_one(unit) for unit in pending_units))
 
-                    # 保存术语表
-                    self.terminology_manager.save_terminology()
+                # 每个文件处理完保存一次术语表
+                self.terminology_manager.save_terminology()
 
             except Exception as e:
                 logger.error(f"提取术语时出错: {e}")
@@ -365,40 +486,61 @@ class Processor:
             翻译单元列表
         """
 
-        # 记录原始Markdown内容
-        logger.info(f"原始Markdown内容:\n{markdown_content}")
+        # 完整内容只在DEBUG级别记录，INFO下连格式化都不做
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("原始Markdown内容:\n%s", markdown_content)
 
-        # 进行分片
+        # 进行分片。当前单元的行先收集在列表里，提交时才join成字符串，
+        # 配合运行中的长度计数器，避免逐行'+='拼接的O(N^2)开销
         units = []
-        current_unit = TranslationUnit()
+        buffer: List[str] = []
+        buffer_length = 0
         in_code_block = False
+
+        def flush_unit(is_code: bool = False) -> None:
+            nonlocal buffer, buffer_length
+            # 分片器自己知道单元是否为代码块，构建时直接填好，
+            # 后续is_code_block判断无需再扫描全文
+            units.append(
+                TranslationUnit(original_text="".join(buffer), is_code=is_code)
+            )
+            buffer = []
+            buffer_length = 0
+
         for line in markdown_content.splitlines():
-            if line.find("```") >= 0:
+            if "```" in line:
                 if in_code_block:
                     #  结束代码块
-                    current_unit.original_text += line
-                    units.append(current_unit)
-                    in_code_block = not in_code_block
-                    current_unit = TranslationUnit()
+                    buffer.append(line)
+                    flush_unit(is_code=True)
+                    in_code_block = False
                 else:
                     # 遇到代码块
-                    if current_unit.original_text:
+                    if buffer_length:
                         # 提交当前单元到列表
-                        units.append(current_unit)
+                        flush_unit()
 
                     # 开始新的代码块
-                    in_code_block = not in_code_block
-                    current_unit = TranslationUnit()
-                    current_unit.original_text += line + "\n"
+                    in_code_block = True
+                    buffer.append(line)
+                    buffer.append("\n")
+                    buffer_length += len(line) + 1
             else:
-                if len(current_unit.original_text) + len(line) > self.min_unit_length:
-                    units.append(current_unit)
-                    current_unit = TranslationUnit()
-                current_unit.original_text += line + "\n"
-        if current_unit.original_text:
-            units.append(current_unit)
-
-        # 记录提取的翻译单元
-        logger.info(f"提取的翻译单元:\n{units}")
+                if buffer_length + len(line) > self.min_unit_length:
+                    flush_unit()
+                # 行和换行符分开追加，不构造line+"\n"的临时字符串
+                buffer.append(line)
+                buffer.append("\n")
+                buffer_length += len(line) + 1
+        if buffer:
+            # 未闭合的代码块也按代码块处理
+            flush_unit(is_code=in_code_block)
+
+        # 记录提取的翻译单元，INFO只记录规模
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("提取的翻译单元:\n%s", units)
+        logger.info(
+            "提取了 %s 个翻译单元，共 %s 个字符", len(units), len(markdown_content)
+        )
 
         return units
@@ -7,11 +7,19 @@
 
 import os
 import re
-import pandas as pd
-from typing import Dict, List, Tuple
+import sys
+import csv
+import time
+import functools
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick未安装时回退到逐术语正则匹配
+    ahocorasick = None
 
 from .config import logger
-from .api_client import api_client
+from .api_client import get_api_client
 
 
 class TerminologyManager:
@@ -26,17 +34,52 @@ class TerminologyManager:
         """
         self.terminology_file = terminology_file
         self.terminology: Dict[str, str] = {}  # 英文 -> 中文
+
+        # 术语表版本号，术语表每次变化时递增，用于让下面的缓存失效
+        self._term_version = 0
+
+        # 是否有未保存的改动，以及上次保存的时间，用于节流写盘
+        self._dirty = False
+        self._last_flush = 0.0
+
+        # Aho-Corasick自动机，首次匹配时构建，术语表变化后重建
+        self._automaton = None
+        self._automaton_version = -1
+
+        # 回退路径的预编译正则列表，同样按术语表版本缓存
+        self._compiled_patterns: Optional[
+            List[Tuple[re.Pattern, re.Pattern, str, str]]
+        ] = None
+        self._compiled_version = -1
+
+        # 相同文本（样板标题、重复段落）在同一版本术语表下的匹配结果
+        # 和术语表字符串直接复用缓存
+        self._find_relevant_terms_cached = functools.lru_cache(maxsize=4096)(
+            self._find_relevant_terms_impl
+        )
+        self._terminology_string_cached = functools.lru_cache(maxsize=4096)(
+            self._terminology_string_impl
+        )
+
         self._load_terminology()
 
     def _load_terminology(self) -> None:
         """从CSV文件加载现有术语表"""
         try:
             if os.path.exists(self.terminology_file):
-                df = pd.read_csv(self.terminology_file)
-                # 将英文术语转为小写，以忽略大小写差异
-                self.terminology = {
-                    eng.lower(): chn for eng, chn in zip(df["english"], df["chinese"])
-                }
+                with open(
+                    self.terminology_file, "r", encoding="utf-8", newline=""
+                ) as f:
+                    # 将英文术语转为小写，以忽略大小写差异；
+                    # intern术语字符串，同一术语在所有翻译单元间共享同一对象
+                    self.terminology = {
+                        sys.intern(row["english"].lower()): sys.intern(
+                            row["chinese"] or ""
+                        )
+                        for row in csv.DictReader(f)
+                        if row.get("english")
+                    }
+                self._term_version += 1
                 logger.info(f"已加载 {len(self.terminology)} 个术语")
         except Exception as e:
             logger.error(f"加载术语表时出错: {e}")
@@ -46,43 +89,57 @@ class TerminologyManager:
         try:
             # 过滤出有翻译的术语
             valid_terms = {k: v for k, v in self.terminology.items() if v and v.strip()}
-            sorted_terms = dict(sorted(valid_terms.items(), key=lambda x: x[0]))
-
-            df = pd.DataFrame(
-                {
-                    "english": list(sorted_terms.keys()),
-                    "chinese": list(sorted_terms.values()),
-                }
-            )
 
             # 确保目录存在
             os.makedirs(os.path.dirname(self.terminology_file), exist_ok=True)
 
-            # 保存到CSV
-            df.to_csv(self.terminology_file, index=False)
+            # 保存到CSV，一次性缓冲写出
+            with open(
+                self.terminology_file,
+                "w",
+                encoding="utf-8",
+                newline="",
+                buffering=1 << 20,
+            ) as f:
+                writer = csv.writer(f)
+                writer.writerow(["english", "chinese"])
+                writer.writerows(sorted(valid_terms.items()))
+
+            self._dirty = False
+            self._last_flush = time.monotonic()
             logger.info(
                 f"术语表已保存到 {self.terminology_file}，共 {len(valid_terms)} 个术语"
             )
         except Exception as e:
             logger.error(f"保存术语表时出错: {e}")
 
-    def extract_terms(self, text: str) -> List[Tuple[str, str]]:
+    def flush_if_dirty(self, min_interval: float = 30.0) -> None:
         """
-        从文本中提取技术术语
+        有未保存的改动且距上次保存足够久时，保存术语表
+
+        用于批量提取过程中的周期性检查点：既不会每个单元都
+        重写整个CSV，又能在长任务中途保留已提取的成果。
+
+        Args:
+            min_interval: 两次保存之间的最小间隔（秒）
+        """
+        if not self._dirty:
+            return
+        if time.monotonic() - self._last_flush < min_interval:
+            return
+        self.save_terminology()
+
+    def _build_extract_prompt(self, text: str) -> str:
+        """
+        构建术语提取的系统提示词
 
         Args:
             text: 要分析的文本
 
         Returns:
-            提取的术语列表 [(英文术语, 中文翻译), ...]
+            系统提示词
         """
-        # 如果文本太短，直接返回空列表
-        if len(text) < 30:
-            logger.info("文本太短，跳过术语提取")
-            return []
-
-        # 系统提示词
-        system_prompt = f"""
+        return f"""
 <角色>你是一位计算机科学领域的术语专家，精通中英双语术语标准化翻译
 <任务>请从以下英文原文中提取计算机专业术语，并生成中英对照表
 <要求>
@@ -104,14 +161,72 @@ Meta Prompting:元提示
 full-stack:全栈
 """
 
+    def extract_terms(self, text: str) -> List[Tuple[str, str]]:
+        """
+        从文本中提取技术术语
+
+        Args:
+            text: 要分析的文本
+
+        Returns:
+            提取的术语列表 [(英文术语, 中文翻译), ...]
+        """
+        # 如果文本太短，直接返回空列表
+        if len(text) < 30:
+            logger.info("文本太短，跳过术语提取")
+            return []
+
+        # 调用API提取术语
         try:
-            # 调用API提取术语
-            try:
-                terms_list = api_client.extract_terms(text, system_prompt)
-            except Exception as e:
-                logger.warning(f"调用术语提取API失败: {str(e)}")
-                return []
+            terms_list = get_api_client().extract_terms(
+                text, self._build_extract_prompt(text)
+            )
+        except Exception as e:
+            logger.warning(f"调用术语提取API失败: {str(e)}")
+            return []
 
+        return self._merge_terms(terms_list)
+
+    async def extract_terms_async(self, text: str) -> List[Tuple[str, str]]:
+        """
+        异步从文本中提取技术术语
+
+        API调用走异步客户端，多个单元可以并发提取；
+        合并术语表在同一个事件循环内完成，不存在并发写入。
+
+        Args:
+            text: 要分析的文本
+
+        Returns:
+            提取的术语列表 [(英文术语, 中文翻译), ...]
+        """
+        # 如果文本太短，直接返回空列表
+        if len(text) < 30:
+            logger.info("文本太短，跳过术语提取")
+            return []
+
+        # 调用API提取术语
+        try:
+            terms_list = await get_api_client().extract_terms_async(
+                text, self._build_extract_prompt(text)
+            )
+        except Exception as e:
+            logger.warning(f"调用术语提取API失败: {str(e)}")
+            return []
+
+        return self._merge_terms(terms_list)
+
+    def _merge_terms(self, terms_list: List[Dict[str, str]]) -> List[Tuple[str, str]]:
+        """
+        将API返回的术语合并进术语表
+
+        Args:
+            terms_list: API返回的术语列表
+
+        Returns:
+            新增术语列表 [(英文术语, 中文翻译), ...]
+        """
+        try:
             # 更新术语表
             new_terms = []
             for term in terms_list:
@@ -135,7 +250,7 @@ full-stack:全栈
                     continue
 
                 # 将英文术语转为小写，以忽略大小写差异
-                english_lower = english.lower()
+                english_lower = sys.intern(english.lower())
 
                 # 如果术语已存在且有翻译，使用已有的
                 if (
@@ -146,7 +261,10 @@ full-stack:全栈
 
                 # 更新术语表
                 if english_lower and (english_lower not in self.terminology):
-                    self.terminology[english_lower] = chinese
+                    self.terminology[english_lower] = sys.intern(chinese)
+                    # 术语表已变化，旧的匹配缓存失效，且有待保存的改动
+                    self._term_version += 1
+                    self._dirty = True
                     if chinese:  # 只添加有翻译的术语到结果中
                         new_terms.append(
                             (english, chinese)
@@ -169,11 +287,23 @@ full-stack:全栈
             术语表字符串，每行一个术语
         """
         if terms:
-            # 使用指定的术语列表
-            return "\n".join([f"{eng}: {chn}" for eng, chn in terms if chn])
+            # 使用指定的术语列表（相同的术语组合直接复用缓存的字符串）
+            return self._terminology_string_cached(tuple(terms))
         else:
             return ""
 
+    def _terminology_string_impl(self, terms: Tuple[Tuple[str, str], ...]) -> str:
+        """
+        生成术语表字符串（实际实现，结果被缓存）
+
+        Args:
+            terms: 术语元组
+
+        Returns:
+            术语表字符串，每行一个术语
+        """
+        return "\n".join([f"{eng}: {chn}" for eng, chn in terms if chn])
+
     def find_relevant_terms(self, text: str) -> List[Tuple[str, str]]:
         """
         从文本中识别已存在于术语表中的术语
@@ -193,38 +323,175 @@ full-stack:全栈
             logger.info("术语表为空，跳过术语匹配")
             return []
 
-        # 按照术语长度排序，确保先匹配最长的术语
-        sorted_terms = sorted(
-            self.terminology.items(), key=lambda x: len(x[0]), reverse=True
-        )
-        found_terms = []
+        # 实际匹配按(文本, 术语表版本)缓存，重复文本直接复用结果
+        return list(self._find_relevant_terms_cached(text, self._term_version))
+
+    @staticmethod
+    def _plural_form(eng: str) -> str:
+        """
+        根据英文构词规则生成术语的复数形式
 
-        for eng, chn in sorted_terms:
+        Args:
+            eng: 英文术语（单数形式）
+
+        Returns:
+            复数形式
+        """
+        if eng.endswith(("s", "x", "z", "ch", "sh")):
+            # 对于以s, x, z, ch, sh结尾的词，复数加es
+            return eng + "es"
+        if eng.endswith("y") and len(eng) > 1 and eng[-2] not in "aeiou":
+            # 以辅音字母+y结尾的词，复数将y变为ies
+            return eng[:-1] + "ies"
+        # 一般情况下直接加s
+        return eng + "s"
+
+    def _get_automaton(self) -> Optional["ahocorasick.Automaton"]:
+        """
+        获取当前术语表对应的Aho-Corasick自动机
+
+        自动机只构建一次并缓存，术语表变化后下次调用时重建。
+
+        Returns:
+            自动机实例，pyahocorasick不可用或术语表无有效术语时为None
+        """
+        if ahocorasick is None:
+            return None
+
+        if (
+            self._automaton is not None
+            and self._automaton_version == self._term_version
+        ):
+            return self._automaton
+
+        automaton = ahocorasick.Automaton()
+        for eng, chn in self.terminology.items():
             if not eng or not chn:  # 跳过没有翻译的术语
                 continue
+            # 同时登记单复数形式，匹配到任一形式都归到原术语
+            for form in (eng, self._plural_form(eng)):
+                automaton.add_word(form, (len(form), eng, chn))
+
+        if len(automaton) == 0:
+            return None
+
+        automaton.make_automaton()
+        self._automaton = automaton
+        self._automaton_version = self._term_version
+        return automaton
+
+    def _find_relevant_terms_impl(
+        self, text: str, term_version: int
+    ) -> Tuple[Tuple[str, str], ...]:
+        """
+        术语匹配的实际实现（结果按术语表版本缓存）
+
+        优先使用Aho-Corasick自动机对文本做单次线性扫描，
+        时间复杂度与术语表大小无关；pyahocorasick不可用时
+        回退到逐术语正则匹配。
+
+        Args:
+            text: 要分析的文本
+            term_version: 调用时的术语表版本号，仅用于区分缓存键
+
+        Returns:
+            文本中出现的术语元组
+        """
+        automaton = self._get_automaton()
+        if automaton is not None:
+            found = self._scan_with_automaton(automaton, text)
+        else:
+            found = self._scan_with_regex(text)
+
+        # 按照术语长度降序排列，保持与逐术语匹配一致的顺序
+        found_terms = sorted(found.items(), key=lambda x: len(x[0]), reverse=True)
+        result = [(eng, chn) for eng, chn in found_terms]
+
+        logger.info(f"在文本中找到 {len(result)} 个相关术语")
+        return tuple(result)
+
+    def _scan_with_automaton(
+        self, automaton: "ahocorasick.Automaton", text: str
+    ) -> Dict[str, str]:
+        """
+        用Aho-Corasick自动机单次扫描文本
+
+        Args:
+            automaton: 当前术语表的自动机
+            text: 要分析的文本
+
+        Returns:
+            命中的术语字典 {英文术语: 中文翻译}
+        """
+        text_lower = text.lower()
+        last = len(text_lower) - 1
+        found: Dict[str, str] = {}
+
+        for end, (length, eng, chn) in automaton.iter(text_lower):
+            if eng in found:
+                continue
+            # 检查词边界：匹配两侧不能是字母、数字或下划线
+            start = end - length + 1
+            before = text_lower[start - 1] if start > 0 else " "
+            after = text_lower[end + 1] if end < last else " "
+            if before.isalnum() or before == "_":
+                continue
+            if after.isalnum() or after == "_":
+                continue
+            found[eng] = chn
 
-            # 检查基本形式
-            pattern = r"\b" + re.escape(eng) + r"\b"
-            if re.search(pattern, text, re.IGNORECASE):
-                found_terms.append((eng, chn))
+        return found
+
+    def _get_compiled_patterns(self) -> List[Tuple[re.Pattern, re.Pattern, str, str]]:
+        """
+        获取当前术语表对应的预编译正则列表
+
+        re模块的全局缓存只保留512个模式，大术语表乘以多段文本
+        很容易被冲掉；这里每个术语表版本只编译一次，匹配时
+        直接走已编译对象。
+
+        Returns:
+            (基本形式正则, 复数形式正则, 英文术语, 中文翻译) 列表，
+            按术语长度降序排列
+        """
+        if (
+            self._compiled_patterns is not None
+            and self._compiled_version == self._term_version
+        ):
+            return self._compiled_patterns
+
+        compiled = []
+        # 构建时就按术语长度降序排好，匹配时无需再排序
+        for eng, chn in sorted(
+            self.terminology.items(), key=lambda x: len(x[0]), reverse=True
+        ):
+            if not eng or not chn:  # 跳过没有翻译的术语
                 continue
+            base_re = re.compile(r"\b" + re.escape(eng) + r"\b", re.IGNORECASE)
+            plural_re = re.compile(
+                r"\b" + re.escape(self._plural_form(eng)) + r"\b", re.IGNORECASE
+            )
+            compiled.append((base_re, plural_re, eng, chn))
+
+        self._compiled_patterns = compiled
+        self._compiled_version = self._term_version
+        return compiled
+
+    def _scan_with_regex(self, text: str) -> Dict[str, str]:
+        """
+        逐术语正则匹配文本（自动机不可用时的回退路径）
+
+        Args:
+            text: 要分析的文本
+
+        Returns:
+            命中的术语字典 {英文术语: 中文翻译}
+        """
+        found: Dict[str, str] = {}
+
+        for base_re, plural_re, eng, chn in self._get_compiled_patterns():
+            # 检查基本形式，再检查可能的复数形式
+            if base_re.search(text) or plural_re.search(text):
+                found[eng] = chn
 
-            # 检查可能的复数形式
-            if eng.endswith(("s", "x", "z", "ch", "sh")):
-                # 对于以s, x, z, ch, sh结尾的词，复数加es
-                plural_pattern = r"\b" + re.escape(eng) + r"es\b"
-            elif eng.endswith("y") and len(eng) > 1 and eng[-2] not in "aeiou":
-                # 以辅音字母+y结尾的词，复数将y变为ies
-                plural_pattern = r"\b" + re.escape(eng[:-1]) + r"ies\b"
-            else:
-                # 一般情况下直接加s
-                plural_pattern = r"\b" + re.escape(eng) + r"s\b"
-
-            # 对于已经是复数形式的术语，不做额外处理
-            if not re.search(plural_pattern, eng, re.IGNORECASE) and re.search(
-                plural_pattern, text, re.IGNORECASE
-            ):
-                found_terms.append((eng, chn))
-
-        logger.info(f"在文本中找到 {len(found_terms)} 个相关术语")
-        return found_terms
+        return found
@@ -5,10 +5,13 @@
 翻译核心模块 - 实现翻译流程
 """
 
+import hashlib
+
 from .config import logger
 from .models import TranslationUnit
 from .terminology_manager import TerminologyManager
-from .api_client import api_client
+from .api_client import get_api_client
+from .cache import create_api_cache
 from .utils import is_code_block
 
 
@@ -22,6 +25,73 @@ class Translator:
         """
         self.terminology_manager = terminology_manager
 
+        # 单元级翻译记忆：相同原文+相同术语的单元（版权头、导航样板等
+        # 跨文件重复内容）直接复用最终译文，跳过全部LLM调用
+        self.cache = create_api_cache()
+
+    @staticmethod
+    def _unit_cache_key(text: str, terminology_str: str) -> bytes:
+        """
+        生成翻译记忆的缓存键
+
+        Args:
+            text: 单元原文
+            terminology_str: 本单元的术语表字符串
+
+        Returns:
+            16字节的blake2b摘要
+        """
+        raw = f"unit\0{text}\0{terminology_str}"
+        return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).digest()
+
+    def _check_translation_memory(self, unit: TranslationUnit) -> bool:
+        """
+        翻译前的快速路径：纯空白内容与翻译记忆命中
+
+        命中时直接填好单元的最终译文。
+
+        Args:
+            unit: 翻译单元
+
+        Returns:
+            是否命中快速路径
+        """
+        # 纯空白内容原样返回，不值得一次API调用
+        if not unit.original_text.strip():
+            unit.translation = unit.original_text
+            unit.polished_translation = unit.original_text
+            return True
+
+        if self.cache is None:
+            return False
+
+        # 术语会进入提示词，必须参与缓存键
+        terminology_str = self._prepare_terminology(unit)
+        cached = self.cache.get(
+            self._unit_cache_key(unit.original_text, terminology_str)
+        )
+        if cached is not None:
+            logger.info("翻译记忆命中，跳过本单元的LLM调用")
+            unit.translation = cached
+            unit.polished_translation = cached
+            return True
+
+        return False
+
+    def _store_translation_memory(self, unit: TranslationUnit) -> None:
+        """
+        将单元的最终译文写入翻译记忆
+
+        Args:
+            unit: 已完成润色的翻译单元
+        """
+        if self.cache is None or not unit.polished_translation:
+            return
+        self.cache.set(
+            self._unit_cache_key(unit.original_text, unit.terminology_str),
+            unit.polished_translation,
+        )
+
     def translate_unit(self, unit: TranslationUnit) -> TranslationUnit:
         """
         对翻译单元执行多步翻译流程
@@ -43,12 +113,99 @@ class Translator:
             unit.polished_translation = unit.original_text
             return unit
 
+        # 空白内容或翻译记忆命中，直接返回最终结果
+        if self._check_translation_memory(unit):
+            return unit
+
         # 1. 使用术语表翻译原文
         self._translate_text(unit)
 
         # 2. 最终润色
         self._polish_translation(unit)
 
+        # 3. 写入翻译记忆
+        self._store_translation_memory(unit)
+
+        return unit
+
+    async def translate_unit_async(self, unit: TranslationUnit) -> TranslationUnit:
+        """
+        异步执行多步翻译流程
+
+        与translate_unit步骤一致，但API调用走异步客户端，
+        多个单元可以在同一个事件循环中并发处理。
+
+        Args:
+            unit: 要翻译的单元
+
+        Returns:
+            翻译后的单元
+        """
+        # 如果是代码块，不进行翻译
+        if is_code_block(unit):
+            unit.translation = unit.original_text
+            unit.polished_translation = unit.original_text
+            return unit
+
+        # 空白内容或翻译记忆命中，直接返回最终结果
+        if self._check_translation_memory(unit):
+            return unit
+
+        # 1. 使用术语表翻译原文
+        await self._translate_text_async(unit)
+
+        # 2. 最终润色
+        await self._polish_translation_async(unit)
+
+        # 3. 写入翻译记忆
+        self._store_translation_memory(unit)
+
+        return unit
+
+    async def translate_stage_async(self, unit: TranslationUnit) -> TranslationUnit:
+        """
+        流水线第一阶段：翻译
+
+        代码块在此阶段直接给出最终结果，普通文本只完成初步翻译，
+        润色交给第二阶段。
+
+        Args:
+            unit: 要翻译的单元
+
+        Returns:
+            完成第一阶段的单元
+        """
+        if is_code_block(unit):
+            unit.translation = unit.original_text
+            unit.polished_translation = unit.original_text
+            return unit
+
+        # 空白内容或翻译记忆命中时polished_translation已填好，
+        # 润色阶段会据此直接跳过
+        if self._check_translation_memory(unit):
+            return unit
+
+        await self._translate_text_async(unit)
+        return unit
+
+    async def polish_stage_async(self, unit: TranslationUnit) -> TranslationUnit:
+        """
+        流水线第二阶段：润色
+
+        Args:
+            unit: 完成第一阶段的单元
+
+        Returns:
+            包含最终翻译的单元
+        """
+        # 第一阶段已经给出最终结果（代码块、翻译记忆命中），直接返回
+        if unit.polished_translation:
+            return unit
+
+        await self._polish_translation_async(unit)
+
+        # 写入翻译记忆，后续相同单元可直接复用
+        self._store_translation_memory(unit)
         return unit
 
     def _extract_terms(self, unit: TranslationUnit) -> TranslationUnit:
@@ -67,69 +224,130 @@ class Translator:
         )
         return unit
 
-    def _translate_text(self, unit: TranslationUnit) -> TranslationUnit:
+    def _prepare_terminology(self, unit: TranslationUnit) -> str:
         """
-        翻译文本
+        查找单元相关术语并生成术语表字符串
 
         Args:
             unit: 翻译单元
 
         Returns:
-            包含翻译结果的翻译单元
+            术语表字符串，没有相关术语时为空字符串
         """
         # 查找文本中出现的相关术语，而不是使用全量术语表
         unit.technical_terms = self.terminology_manager.find_relevant_terms(
             unit.original_text
         )
 
-        # 只有当找到相关术语时，才将术语信息添加到请求中
-        terminology_str = ""
+        # 只有当找到相关术语时，才将术语信息添加到请求中；
+        # 字符串缓存在单元上，润色阶段直接复用，不再重复生成
         if unit.technical_terms:
-            # 准备术语表字符串，只包含相关术语
-            terminology_str = self.terminology_manager.get_terminology_string(
+            logger.info(f"翻译请求中包含 {len(unit.technical_terms)} 个术语")
+            unit.terminology_str = self.terminology_manager.get_terminology_string(
                 unit.technical_terms
             )
-            logger.info(f"翻译请求中包含 {len(unit.technical_terms)} 个术语")
         else:
             logger.info("翻译请求中不包含术语信息")
+            unit.terminology_str = ""
+
+        return unit.terminology_str
+
+    def _translate_text(self, unit: TranslationUnit) -> TranslationUnit:
+        """
+        翻译文本
+
+        Args:
+            unit: 翻译单元
+
+        Returns:
+            包含翻译结果的翻译单元
+        """
+        terminology_str = self._prepare_terminology(unit)
 
         # 调用API翻译
-        unit.translation = api_client.translate_text(
+        unit.translation = get_api_client().translate_text(
             unit.original_text, terminology_str
         )
         return unit
 
-    def _polish_translation(self, unit: TranslationUnit) -> None:
+    async def _translate_text_async(self, unit: TranslationUnit) -> TranslationUnit:
         """
-        润色翻译
+        异步翻译文本
 
         Args:
             unit: 翻译单元
 
         Returns:
-            包含润色后翻译的翻译单元
+            包含翻译结果的翻译单元
+        """
+        terminology_str = self._prepare_terminology(unit)
+
+        # 调用API翻译
+        unit.translation = await get_api_client().translate_text_async(
+            unit.original_text, terminology_str
+        )
+        return unit
+
+    def _should_skip_polish(self, unit: TranslationUnit) -> bool:
+        """
+        判断是否跳过润色
+
+        Args:
+            unit: 翻译单元
+
+        Returns:
+            是否跳过润色
         """
         # 如果翻译失败或为空，跳过润色
         if not unit.translation:
             unit.polished_translation = ""
             logger.info("无法润色翻译，因为翻译为空")
-            return unit
+            return True
 
         # 如果翻译与原文相同，可能是代码块等不需要翻译的内容
         if unit.translation == unit.original_text:
             unit.polished_translation = unit.translation
             logger.info("翻译与原文相同，跳过润色")
+            return True
+
+        return False
+
+    def _polish_translation(self, unit: TranslationUnit) -> TranslationUnit:
+        """
+        润色翻译
+
+        Args:
+            unit: 翻译单元
+
+        Returns:
+            包含润色后翻译的翻译单元
+        """
+        if self._should_skip_polish(unit):
             return unit
 
-        # 只有当有术语时，才将术语信息添加到请求中
-        terminology_str = ""
-        if unit.technical_terms:
-            terminology_str = self.terminology_manager.get_terminology_string(
-                unit.technical_terms
-            )
+        # 调用API润色翻译，复用翻译阶段生成的术语字符串
+        unit.polished_translation = get_api_client().polish_translation(
+            unit.original_text, unit.translation, unit.terminology_str
+        )
+        return unit
+
+    async def _polish_translation_async(
+        self, unit: TranslationUnit
+    ) -> TranslationUnit:
+        """
+        异步润色翻译
+
+        Args:
+            unit: 翻译单元
+
+        Returns:
+            包含润色后翻译的翻译单元
+        """
+        if self._should_skip_polish(unit):
+            return unit
 
-        # 调用API润色翻译
-        unit.polished_translation = api_client.polish_translation(
-            unit.original_text, unit.translation, terminology_str
+        # 调用API润色翻译，复用翻译阶段生成的术语字符串
+        unit.polished_translation = await get_api_client().polish_translation_async(
+            unit.original_text, unit.translation, unit.terminology_str
         )
         return unit
@@ -8,7 +8,7 @@
 import os
 import sys
 from datetime import datetime
-from typing import Optional
+from typing import Optional, TextIO
 from .models import TranslationUnit
 
 
@@ -76,6 +76,7 @@ def print_progress(
     decimals: int = 1,
     length: int = 50,
     fill: str = "█",
+    file: Optional[TextIO] = None,
 ) -> None:
     """
     打印进度条
@@ -88,26 +89,33 @@ def print_progress(
         decimals: 百分比小数位数
         length: 进度条长度
         fill: 进度条填充字符
+        file: 输出流，默认为标准输出
     """
+    out = file if file is not None else sys.stdout
     percent = ("{0:." + str(decimals) + "f}").format(100 * (current / float(total)))
     filled_length = int(length * current // total)
     bar = fill * filled_length + "-" * (length - filled_length)
-    sys.stdout.write(f"\r{prefix} |{bar}| {percent}% {suffix}")
-    sys.stdout.flush()
+    out.write(f"\r{prefix} |{bar}| {percent}% {suffix}")
 
     # 如果完成则打印换行
     if current == total:
-        print()
+        out.write("\n")
+    out.flush()
 
 
 def is_code_block(unit: TranslationUnit) -> bool:
     """
     判断是否是代码块
 
+    结果缓存在单元的is_code字段上，翻译各阶段重复判断时
+    不再重新扫描全文；分片器在构建单元时通常已经填好。
+
     Args:
         unit: 翻译单元
 
     Returns:
         是否是代码块
     """
-    return unit.original_text.find("```") >= 0
+    if unit.is_code is None:
+        unit.is_code = "```" in unit.original_text
+    return unit.is_code
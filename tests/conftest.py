@@ -8,10 +8,17 @@
 import os
 import sys
 import pytest
+from unittest.mock import MagicMock
 
 # 添加项目根目录到Python路径
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
+# 会话开始即加载核心模块（translator会连带拉起api_client、
+# terminology_manager、models等），各测试文件随后的import
+# 都只剩sys.modules查找
+import src.translator.translator  # noqa: E402,F401
+import src.translator.utils  # noqa: E402,F401
+
 # 测试数据目录
 TEST_DATA_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "test_data"))
 TEST_INPUT_DIR = os.path.join(TEST_DATA_DIR, "input")
@@ -22,6 +29,33 @@ TEST_TERMINOLOGY_FILE = os.path.join(TEST_DATA_DIR, "terminology.csv")
 TEST_HTML_SAMPLE = os.path.join(TEST_INPUT_DIR, "sample.html")
 
 
+@pytest.fixture(autouse=True)
+def mock_openai_create(monkeypatch):
+    """把OpenAI同步补全接口统一替换为Mock
+
+    每个测试自动生效：测试不再各自进出patch上下文管理器，
+    也保证任何测试都不会真的发起API请求。需要定制响应的测试
+    直接设置返回值或side_effect即可。
+    """
+    mock_create = MagicMock()
+    monkeypatch.setattr(
+        "openai.resources.chat.completions.Completions.create", mock_create
+    )
+    return mock_create
+
+
+@pytest.fixture(scope="session")
+def api_client():
+    """返回整个测试会话共享的API客户端实例
+
+    ApiClient初始化会构建HTTP连接池，按测试重建纯属浪费；
+    测试只通过mock与它交互，不会留下会话间状态。
+    """
+    from src.translator.api_client import ApiClient
+
+    return ApiClient()
+
+
 @pytest.fixture
 def sample_html_path():
     """返回测试HTML样本的路径"""
@@ -6,115 +6,147 @@ API模块单元测试
 """
 
 import pytest
-from unittest.mock import patch, MagicMock
+from types import SimpleNamespace
 
-# 导入测试目标
-from src.translator.api_client import ApiClient
+
+def _resp(text):
+    """构造最小的补全响应对象
+
+    被测代码只读取choices[0].message.content和usage.total_tokens，
+    用SimpleNamespace比逐个搭MagicMock便宜得多。
+    """
+    return SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content=text))],
+        usage=SimpleNamespace(total_tokens=0),
+    )
 
 
 class TestApiClient:
-    """API客户端测试"""
+    """API客户端测试
 
-    @pytest.fixture
-    def api_client(self):
-        """返回API客户端实例"""
-        return ApiClient()
+    api_client夹具由conftest.py提供，整个会话共享同一个实例；
+    OpenAI接口由autouse的mock_openai_create夹具统一替换。
+    """
 
     def test_init(self, api_client):
         """测试API客户端初始化"""
         # 此测试主要是为了确保初始化不会抛出异常
         assert api_client is not None
 
-    def test_translate_text(self, api_client):
-        """测试文本翻译API调用"""
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = "这是翻译后的文本"
-
-        with patch(
-            "openai.resources.chat.completions.Completions.create",
-            return_value=mock_response,
-        ):
-            result = api_client.translate_text(
-                "This is the text to translate", "terminology string"
-            )
-
-            # 验证返回结果
-            assert result == "这是翻译后的文本"
-
-    def test_translate_text_error_handling(self, api_client):
-        """测试文本翻译错误处理"""
-        original_text = "This is the text to translate"
-
-        with patch(
-            "openai.resources.chat.completions.Completions.create",
-            side_effect=Exception("API error"),
-        ):
-            result = api_client.translate_text(original_text, "terminology")
-
-            # 验证错误时返回原文
-            assert result == original_text
-
-    def test_polish_translation(self, api_client):
-        """测试翻译润色API调用"""
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = "润色后的文本"
-
-        with patch(
-            "openai.resources.chat.completions.Completions.create",
-            return_value=mock_response,
-        ):
-            result = api_client.polish_translation(
-                "Original text", "Translated text", "terminology string"
-            )
-
-            # 验证返回结果
-            assert result == "润色后的文本"
-
-    def test_polish_translation_error_handling(self, api_client):
-        """测试翻译润色错误处理"""
-        translation = "Translated text"
-
-        with patch(
-            "openai.resources.chat.completions.Completions.create",
-            side_effect=Exception("API error"),
-        ):
-            result = api_client.polish_translation(
-                "Original", translation, "terminology"
-            )
-
-            # 验证错误时返回原翻译
-            assert result == translation
-
-    def test_call_api(self, api_client):
+    @pytest.mark.parametrize(
+        "method_name, args, response_text",
+        [
+            (
+                "translate_text",
+                ("This is the text to translate", "terminology string"),
+                "这是翻译后的文本",
+            ),
+            (
+                "polish_translation",
+                ("Original text", "Translated text", "terminology string"),
+                "润色后的文本",
+            ),
+        ],
+    )
+    def test_api_method_success(
+        self, api_client, mock_openai_create, method_name, args, response_text
+    ):
+        """测试各API方法的正常调用"""
+        mock_openai_create.return_value = _resp(response_text)
+
+        result = getattr(api_client, method_name)(*args)
+
+        # 验证返回结果
+        assert result == response_text
+
+    @pytest.mark.parametrize(
+        "method_name, args, fallback",
+        [
+            # 翻译出错时返回原文
+            (
+                "translate_text",
+                ("This is the text to translate", "terminology"),
+                "This is the text to translate",
+            ),
+            # 润色出错时返回原翻译
+            (
+                "polish_translation",
+                ("Original", "Translated text", "terminology"),
+                "Translated text",
+            ),
+        ],
+    )
+    def test_api_method_error_handling(
+        self, api_client, mock_openai_create, method_name, args, fallback
+    ):
+        """测试各API方法的错误兜底"""
+        mock_openai_create.side_effect = Exception("API error")
+
+        result = getattr(api_client, method_name)(*args)
+
+        # 验证错误时返回兜底值
+        assert result == fallback
+
+    @pytest.mark.parametrize("batch_size", [2, 3])
+    def test_translate_texts(self, api_client, mock_openai_create, batch_size):
+        """测试多段合并翻译只发一次请求"""
+        texts = [f"text {i + 1}" for i in range(batch_size)]
+        response = "\n".join(
+            f"<段落 {i + 1}>\n译文{i + 1}" for i in range(batch_size)
+        )
+        mock_openai_create.return_value = _resp(response)
+
+        result = api_client.translate_texts(texts, "terminology")
+
+        # 验证各段按原顺序拆回，且只调用了一次API
+        assert result == [f"译文{i + 1}" for i in range(batch_size)]
+        mock_openai_create.assert_called_once()
+
+    def test_translate_texts_partial_parse(self, api_client, mock_openai_create):
+        """测试响应缺段时回退为原文"""
+        mock_openai_create.return_value = _resp("<段落 2>\n译文2")
+
+        result = api_client.translate_texts(["text 1", "text 2"], "")
+
+        # 解析不到的第一段回退为原文
+        assert result == ["text 1", "译文2"]
+
+    def test_call_api(self, api_client, mock_openai_create):
         """测试底层API调用方法"""
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = "API response"
+        mock_openai_create.return_value = _resp("API response")
+
+        result = api_client._call_api("System prompt", "User prompt", 0.5)
+
+        # 验证返回结果
+        assert result == "API response"
 
-        with patch(
-            "openai.resources.chat.completions.Completions.create",
-            return_value=mock_response,
-        ) as mock_create:
-            result = api_client._call_api("System prompt", "User prompt", 0.5)
+        # 验证API调用参数
+        mock_openai_create.assert_called_once()
+        args, kwargs = mock_openai_create.call_args
+        assert kwargs["temperature"] == 0.3
 
-            # 验证返回结果
-            assert result == "API response"
+    def test_call_api_uses_cache(
+        self, api_client, mock_openai_create, tmp_path, monkeypatch
+    ):
+        """测试相同请求第二次直接命中磁盘缓存"""
+        from src.translator.cache import ApiCache
 
-            # 验证API调用参数
-            mock_create.assert_called_once()
-            args, kwargs = mock_create.call_args
-            assert kwargs["temperature"] == 0.3
+        monkeypatch.setattr(api_client, "cache", ApiCache(str(tmp_path)))
+        mock_openai_create.return_value = _resp("cached response")
 
-    def test_call_api_error_handling(self, api_client):
+        first = api_client._call_api("model", "System prompt", "User prompt")
+        second = api_client._call_api("model", "System prompt", "User prompt")
+
+        # 两次返回一致，但API只被真正调用了一次
+        assert first == second == "cached response"
+        mock_openai_create.assert_called_once()
+
+    def test_call_api_error_handling(self, api_client, mock_openai_create):
         """测试底层API调用错误处理"""
-        with patch(
-            "openai.resources.chat.completions.Completions.create",
-            side_effect=Exception("API error"),
-        ):
-            with pytest.raises(Exception) as excinfo:
-                api_client._call_api("model", "System prompt", "User prompt")
-
-            # 验证异常被抛出
-            assert "API error" in str(excinfo.value)
+        mock_openai_create.side_effect = Exception("API error")
+
+        with pytest.raises(Exception) as excinfo:
+            api_client._call_api("model", "System prompt", "User prompt")
+
+        # 验证异常被抛出
+        assert "API error" in str(excinfo.value)
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+缓存模块单元测试
+"""
+
+import os
+from unittest.mock import patch
+
+# 导入测试目标
+from src.translator.cache import ApiCache, create_api_cache
+
+
+class TestApiCache:
+    """API响应缓存测试"""
+
+    def test_get_miss(self, tmp_path):
+        """测试未命中缓存时返回None"""
+        cache = ApiCache(str(tmp_path / "cache"))
+        key = ApiCache.make_key("model", "system", "user", 0.3)
+
+        assert cache.get(key) is None
+
+    def test_set_and_get(self, tmp_path):
+        """测试写入后可以读出"""
+        cache = ApiCache(str(tmp_path / "cache"))
+        key = ApiCache.make_key("model", "system", "user", 0.3)
+
+        cache.set(key, "翻译结果")
+
+        assert cache.get(key) == "翻译结果"
+
+    def test_persistence(self, tmp_path):
+        """测试缓存跨实例持久化"""
+        cache_dir = str(tmp_path / "cache")
+        key = ApiCache.make_key("model", "system", "user", 0.3)
+
+        ApiCache(cache_dir).set(key, "持久化结果")
+
+        # 新实例读取同一目录
+        assert ApiCache(cache_dir).get(key) == "持久化结果"
+
+    def test_make_key_distinguishes_params(self):
+        """测试不同请求参数生成不同的键"""
+        key = ApiCache.make_key("model", "system", "user", 0.3)
+
+        assert key != ApiCache.make_key("other", "system", "user", 0.3)
+        assert key != ApiCache.make_key("model", "other", "user", 0.3)
+        assert key != ApiCache.make_key("model", "system", "other", 0.3)
+        assert key != ApiCache.make_key("model", "system", "user", 1.3)
+
+    def test_create_api_cache_disabled(self):
+        """测试通过环境变量禁用缓存"""
+        with patch.dict(os.environ, {"TRANSLATE_CACHE": "0"}):
+            assert create_api_cache() is None
+
+    def test_create_api_cache_custom_dir(self, tmp_path):
+        """测试通过环境变量指定缓存目录"""
+        cache_dir = str(tmp_path / "custom_cache")
+        env = {"TRANSLATE_CACHE": "1", "TRANSLATE_CACHE_DIR": cache_dir}
+
+        with patch.dict(os.environ, env):
+            cache = create_api_cache()
+
+        assert cache is not None
+        assert os.path.isdir(cache_dir)
@@ -6,6 +6,7 @@
 """
 
 import os
+import pytest
 from unittest.mock import patch
 
 # 导入测试目标
@@ -15,35 +16,47 @@ from src.translator.config import Config
 class TestConfig:
     """配置类测试"""
 
-    def test_config_initialization(self):
-        """测试配置初始化默认值"""
-        with patch.dict(os.environ, {}, clear=True):
+    @pytest.mark.parametrize(
+        "env, expected, expect_warning",
+        [
+            # 空环境：使用默认值，缺少API密钥应发出警告
+            (
+                {},
+                {
+                    "api_key": None,
+                    "chat_model_name": "deepseek-chat",
+                    "reasoner_model_name": "deepseek-reasoner",
+                    "max_tokens": 8192,
+                },
+                True,
+            ),
+            # 完整环境：所有配置从环境变量读取，无警告
+            (
+                {
+                    "DEEPSEEK_API_KEY": "test-api-key",
+                    "CHAT_MODEL_NAME": "test-chat-model",
+                    "REASONER_MODEL_NAME": "test-reasoner-model",
+                    "MAX_TOKENS": "1024",
+                },
+                {
+                    "api_key": "test-api-key",
+                    "chat_model_name": "test-chat-model",
+                    "reasoner_model_name": "test-reasoner-model",
+                    "max_tokens": 1024,
+                },
+                False,
+            ),
+        ],
+    )
+    def test_config(self, env, expected, expect_warning, caplog):
+        """测试配置初始化：默认值、环境变量读取与缺少密钥的警告"""
+        with patch.dict(os.environ, env, clear=True):
             config = Config()
-            # 测试默认值设置正确
-            assert config.chat_model_name == "deepseek-chat"
-            assert config.reasoner_model_name == "deepseek-reasoner"
-            assert config.max_tokens == 8192
-
-    def test_config_from_env(self, tmpdir):
-        """测试从环境变量读取配置"""
-        test_env = {
-            "DEEPSEEK_API_KEY": "test-api-key",
-            "CHAT_MODEL_NAME": "test-chat-model",
-            "REASONER_MODEL_NAME": "test-reasoner-model",
-            "MAX_TOKENS": "1024",
-        }
-
-        with patch.dict(os.environ, test_env, clear=True):
-            config = Config()
-            # 测试环境变量被正确读取
-            assert config.api_key == "test-api-key"
-            assert config.chat_model_name == "test-chat-model"
-            assert config.reasoner_model_name == "test-reasoner-model"
-            assert config.max_tokens == 1024
-
-    def test_warning_for_missing_api_key(self, caplog):
-        """测试缺少API密钥时发出警告"""
-        with patch.dict(os.environ, {}, clear=True):
-            Config()
-            # 验证日志中有警告消息
+
+        # 验证各配置项取值
+        for attr, value in expected.items():
+            assert getattr(config, attr) == value
+
+        # 只在预期有警告的用例里检查日志
+        if expect_warning:
             assert any("未设置API密钥" in record.message for record in caplog.records)
@@ -5,20 +5,15 @@
 术语提取功能单元测试
 """
 
-import pytest
 from unittest.mock import patch
 
-# 导入测试目标
-from src.translator.api_client import ApiClient
-
 
 class TestExtractTerms:
-    """术语提取功能测试"""
+    """术语提取功能测试
 
-    @pytest.fixture
-    def api_client(self):
-        """返回API客户端实例"""
-        return ApiClient()
+    api_client夹具由conftest.py提供，整个会话共享同一个实例，
+    不再为每个测试重建OpenAI客户端。
+    """
 
     def test_extract_terms_normal(self, api_client):
         """测试正常情况下的术语提取"""
@@ -7,42 +7,121 @@
 
 import os
 import pytest
-from unittest.mock import Mock, patch, mock_open
+from unittest.mock import AsyncMock, Mock
 
 from src.translator.processor import Processor
 from src.translator.models import TranslationUnit, TranslationContext
-from src.translator.terminology_manager import TerminologyManager
-from src.translator.translator import Translator
 
+# 本模块大量读写真实文件，标记为slow以便快速回归时跳过
+pytestmark = pytest.mark.slow
 
-@pytest.fixture
-def mock_terminology_manager():
-    """创建模拟术语管理器"""
-    manager = Mock(spec=TerminologyManager)
-    manager.extract_terms.return_value = [("term1", "术语1"), ("term2", "术语2")]
-    manager.find_relevant_terms.return_value = [("term1", "术语1")]
-    return manager
 
+# 模拟翻译单元的行为
+def translate_unit_side_effect(unit):
+    if unit.original_text.find("```") >= 0:
+        # 代码块不翻译
+        unit.translation = unit.original_text
+        unit.polished_translation = unit.original_text
+    else:
+        # 普通文本翻译
+        unit.translation = f"翻译: {unit.original_text}"
+        unit.polished_translation = f"润色翻译: {unit.original_text}"
+    return unit
 
-@pytest.fixture
-def mock_translator():
-    """创建模拟翻译器"""
-    translator = Mock(spec=Translator)
 
-    # 模拟翻译单元的行为
-    def translate_unit_side_effect(unit):
-        if unit.original_text.find("```") >= 0:
-            # 代码块不翻译
-            unit.translation = unit.original_text
-            unit.polished_translation = unit.original_text
-        else:
-            # 普通文本翻译
-            unit.translation = f"翻译: {unit.original_text}"
-            unit.polished_translation = f"润色翻译: {unit.original_text}"
-        return unit
+# 模拟流水线两个阶段的行为
+def translate_stage_side_effect(unit):
+    if unit.original_text.find("```") >= 0:
+        # 代码块不翻译
+        unit.translation = unit.original_text
+        unit.polished_translation = unit.original_text
+    else:
+        # 普通文本翻译
+        unit.translation = f"翻译: {unit.original_text}"
+    return unit
+
+
+def polish_stage_side_effect(unit):
+    if not unit.polished_translation:
+        unit.polished_translation = f"润色翻译: {unit.original_text}"
+    return unit
+
+
+class _StubTerminologyManager:
+    """术语管理器替身
+
+    只显式挂出Processor用到的方法。Mock(spec=...)构造时要对整个类做
+    属性内省，手写的轻量替身一次构建完毕，行为语义不变。
+    """
+
+    def __init__(self):
+        self.extract_terms = Mock()
+        self.extract_terms_async = AsyncMock()
+        self.find_relevant_terms = Mock()
+        self.save_terminology = Mock()
+        self.flush_if_dirty = Mock()
+
+    def reset(self):
+        self.extract_terms.reset_mock()
+        self.extract_terms_async.reset_mock()
+        self.find_relevant_terms.reset_mock()
+        self.save_terminology.reset_mock()
+        self.flush_if_dirty.reset_mock()
 
-    translator.translate_unit.side_effect = translate_unit_side_effect
-    return translator
+
+class _StubTranslator:
+    """翻译器替身，同上只挂出Processor用到的方法"""
+
+    def __init__(self):
+        self.translate_unit = Mock()
+        self.translate_unit_async = AsyncMock()
+        self.translate_stage_async = AsyncMock()
+        self.polish_stage_async = AsyncMock()
+
+    def reset(self):
+        self.translate_unit.reset_mock()
+        self.translate_unit_async.reset_mock()
+        self.translate_stage_async.reset_mock()
+        self.polish_stage_async.reset_mock()
+
+
+@pytest.fixture(scope="module")
+def mock_terminology_manager():
+    """创建模拟术语管理器（模块级共享，每个测试前重置）"""
+    return _StubTerminologyManager()
+
+
+@pytest.fixture(scope="module")
+def mock_translator():
+    """创建模拟翻译器（模块级共享，每个测试前重置）"""
+    return _StubTranslator()
+
+
+@pytest.fixture(autouse=True)
+def _reset_mocks(mock_terminology_manager, mock_translator):
+    """每个测试前把共享替身恢复到默认配置
+
+    共享实例加统一重置比每个测试重建便宜得多。
+    """
+    mock_terminology_manager.reset()
+    mock_terminology_manager.extract_terms.side_effect = None
+    mock_terminology_manager.extract_terms.return_value = [
+        ("term1", "术语1"),
+        ("term2", "术语2"),
+    ]
+    mock_terminology_manager.extract_terms_async.side_effect = None
+    mock_terminology_manager.extract_terms_async.return_value = [
+        ("term1", "术语1"),
+        ("term2", "术语2"),
+    ]
+    mock_terminology_manager.find_relevant_terms.side_effect = None
+    mock_terminology_manager.find_relevant_terms.return_value = [("term1", "术语1")]
+
+    mock_translator.reset()
+    mock_translator.translate_unit.side_effect = translate_unit_side_effect
+    mock_translator.translate_unit_async.side_effect = translate_unit_side_effect
+    mock_translator.translate_stage_async.side_effect = translate_stage_side_effect
+    mock_translator.polish_stage_async.side_effect = polish_stage_side_effect
 
 
 @pytest.fixture
@@ -61,6 +140,24 @@ def processor(mock_terminology_manager, mock_translator, tmp_path):
     )
 
 
+@pytest.fixture
+def fake_fs_processor(fs, mock_terminology_manager, mock_translator):
+    """创建基于内存文件系统的处理器实例
+
+    纯文件操作的测试走pyfakefs，读写都是内存字典操作，
+    不产生真实磁盘I/O；依赖真实文件系统语义的测试仍用tmp_path。
+    """
+    fs.create_dir("/input")
+    fs.create_dir("/output")
+
+    return Processor(
+        input_dir="/input",
+        output_dir="/output",
+        terminology_manager=mock_terminology_manager,
+        translator=mock_translator,
+    )
+
+
 class TestProcessor:
     """测试处理器类"""
 
@@ -73,56 +170,35 @@ class TestProcessor:
         assert isinstance(processor.context, TranslationContext)
         assert processor.min_unit_length == 4000
 
-    def test_read_markdown_file(self, processor, tmp_path):
+    def test_read_markdown_file(self, fake_fs_processor, fs):
         """测试读取Markdown文件"""
-        # 创建测试文件
-        test_file = tmp_path / "input" / "test.md"
+        # 创建测试文件（内存文件系统，无真实磁盘I/O）
         test_content = "# Test\n\nThis is a test file."
-        test_file.write_text(test_content)
+        fs.create_file("/input/test.md", contents=test_content)
 
         # 测试读取
-        content = processor._read_markdown_file(str(test_file))
+        content = fake_fs_processor._read_markdown_file("/input/test.md")
         assert content == test_content
 
-    def test_read_markdown_file_with_encoding_error(self, processor):
+    def test_read_markdown_file_with_encoding_error(self, processor, tmp_path):
         """测试读取编码错误的Markdown文件"""
-        with patch(
-            "builtins.open",
-            side_effect=[
-                UnicodeDecodeError("utf-8", b"\x80", 1, 2, "invalid start byte"),
-                mock_open(read_data="fallback content")(),
-            ],
-        ) as m:
-            content = processor._read_markdown_file("test.md")
-            assert content == "fallback content"
-            assert m.call_count == 2
-
-    def test_initialize_output_file(self, processor, tmp_path):
+        # 写入非UTF-8内容，应回退到latin-1解码
+        test_file = tmp_path / "input" / "latin1.md"
+        test_file.write_bytes("café".encode("latin-1"))
+
+        content = processor._read_markdown_file(str(test_file))
+        assert content == "café"
+
+    def test_initialize_output_file(self, fake_fs_processor, fs):
         """测试初始化输出文件"""
-        output_file = tmp_path / "output" / "subdir" / "test.md"
-        processor._initialize_output_file(str(output_file))
+        output_file = "/output/subdir/test.md"
+        fake_fs_processor._initialize_output_file(output_file)
 
         # 验证目录已创建
-        assert os.path.exists(os.path.dirname(str(output_file)))
+        assert os.path.exists(os.path.dirname(output_file))
         # 验证文件已创建且为空
-        assert os.path.exists(str(output_file))
-        assert os.path.getsize(str(output_file)) == 0
-
-    def test_append_to_output_file(self, processor, tmp_path):
-        """测试追加内容到输出文件"""
-        output_file = tmp_path / "output" / "test.md"
-        output_file.parent.mkdir(exist_ok=True)
-        output_file.write_text("")
-
-        # 追加内容
-        processor._append_to_output_file(str(output_file), "Test content")
-
-        # 验证内容
-        assert output_file.read_text() == "Test content\n\n"
-
-        # 再次追加
-        processor._append_to_output_file(str(output_file), "More content")
-        assert output_file.read_text() == "Test content\n\nMore content\n\n"
+        assert os.path.exists(output_file)
+        assert os.path.getsize(output_file) == 0
 
     def test_get_output_path(self, processor, tmp_path):
         """测试获取输出路径"""
@@ -138,9 +214,8 @@ class TestProcessor:
         expected_path = str(tmp_path / "output" / "test.md")
         assert output_path == expected_path
 
-    def test_extract_translation_units(self, processor):
-        """测试提取翻译单元"""
-        # 测试普通文本
+    def test_extract_units_plain(self, processor):
+        """测试提取普通文本的翻译单元"""
         markdown_content = "# 标题\n\n这是一段普通文本。\n\n这是另一段文本。"
         units = processor._extract_translation_units(markdown_content)
         assert len(units) == 1
@@ -149,7 +224,8 @@ class TestProcessor:
             == "# 标题\n\n这是一段普通文本。\n\n这是另一段文本。\n"
         )
 
-        # 测试包含代码块的文本
+    def test_extract_units_code_block(self, processor):
+        """测试代码块单独成为一个单元"""
         markdown_content = "# 标题\n\n```python\nprint('Hello')\n```\n\n这是普通文本。"
         units = processor._extract_translation_units(markdown_content)
         assert len(units) == 3
@@ -157,8 +233,10 @@ class TestProcessor:
         assert "print('Hello')" in units[1].original_text
         assert "```" in units[1].original_text
 
-        # 测试长文本分片
-        long_text = "A" * 5000
+    def test_extract_units_splits_long(self, processor):
+        """测试超过阈值的长文本会被分片"""
+        # 刚好超过min_unit_length即可触发分片，不需要更长的输入
+        long_text = "A" * (processor.min_unit_length + 1)
         units = processor._extract_translation_units(long_text)
         assert len(units) > 1
 
@@ -175,7 +253,7 @@ class TestProcessor:
         # 验证结果
         assert result.success
         assert os.path.exists(result.output_file)
-        assert mock_translator.translate_unit.called
+        assert mock_translator.translate_stage_async.called
 
         # 验证输出文件内容
         output_content = open(result.output_file, "r").read()
@@ -193,16 +271,15 @@ class TestProcessor:
         assert not result.success
         assert result.error_message != ""
 
-    def test_find_markdown_files(self, processor, tmp_path):
+    def test_find_markdown_files(self, fake_fs_processor, fs):
         """测试查找Markdown文件"""
         # 创建测试文件
-        (tmp_path / "input" / "test1.md").write_text("content")
-        (tmp_path / "input" / "subdir").mkdir()
-        (tmp_path / "input" / "subdir" / "test2.md").write_text("content")
-        (tmp_path / "input" / "test.txt").write_text("content")  # 非md文件
+        fs.create_file("/input/test1.md", contents="content")
+        fs.create_file("/input/subdir/test2.md", contents="content")
+        fs.create_file("/input/test.txt", contents="content")  # 非md文件
 
         # 查找文件
-        files = processor._find_markdown_files()
+        files = fake_fs_processor._find_markdown_files()
 
         # 验证结果
         assert len(files) == 2
@@ -233,7 +310,7 @@ class TestProcessor:
         (tmp_path / "input" / "test1.md").write_text("content1")
 
         # 模拟翻译错误
-        mock_translator.translate_unit.side_effect = Exception("模拟翻译错误")
+        mock_translator.translate_stage_async.side_effect = Exception("模拟翻译错误")
 
         # 执行翻译
         success_count, failed_files = processor.translate_directory()
@@ -253,7 +330,7 @@ class TestProcessor:
         processor.extract_terminology(str(input_file))
 
         # 验证结果
-        assert mock_terminology_manager.extract_terms.called
+        assert mock_terminology_manager.extract_terms_async.called
         assert mock_terminology_manager.save_terminology.called
 
     def test_process_translation_units(self, processor, tmp_path, mock_translator):
@@ -271,7 +348,7 @@ class TestProcessor:
         processor._process_translation_units(units, str(output_file))
 
         # 验证结果
-        assert mock_translator.translate_unit.call_count == 2
+        assert mock_translator.translate_stage_async.call_count == 2
         assert output_file.exists()
         content = output_file.read_text()
         assert "润色翻译: Text 1" in content
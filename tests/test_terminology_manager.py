@@ -6,30 +6,41 @@
 """
 
 import os
+import csv
 import pytest
-import pandas as pd
 from unittest.mock import patch
 
 # 导入测试目标
 from src.translator.terminology_manager import TerminologyManager
 
+# 本模块读写真实CSV文件，标记为slow以便快速回归时跳过
+pytestmark = pytest.mark.slow
+
+
+@pytest.fixture(scope="session")
+def sample_terminology_file(tmp_path_factory):
+    """创建一个样本术语表文件
+
+    文件只读不改，整个会话写一次即可；
+    用stdlib csv生成，测试模块不再背上pandas的导入开销。
+    """
+    file_path = str(tmp_path_factory.mktemp("term") / "test_terminology.csv")
+    with open(file_path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["english", "chinese"])
+        writer.writerows(
+            [
+                ("data structure", "数据结构"),
+                ("algorithm", "算法"),
+                ("binary search tree", "二叉搜索树"),
+            ]
+        )
+    return file_path
+
 
 class TestTerminologyManager:
     """术语管理器测试"""
 
-    @pytest.fixture
-    def sample_terminology_file(self, tmpdir):
-        """创建一个样本术语表文件"""
-        file_path = os.path.join(tmpdir, "test_terminology.csv")
-        df = pd.DataFrame(
-            {
-                "english": ["data structure", "algorithm", "binary search tree"],
-                "chinese": ["数据结构", "算法", "二叉搜索树"],
-            }
-        )
-        df.to_csv(file_path, index=True)
-        return file_path
-
     def test_init_with_file(self, sample_terminology_file):
         """测试加载指定的术语表文件"""
         manager = TerminologyManager(sample_terminology_file)
@@ -63,10 +74,11 @@ class TestTerminologyManager:
 
         # 验证文件被创建并且内容正确
         assert os.path.exists(file_path)
-        df = pd.read_csv(file_path)
-        assert len(df) == 2  # 空术语被过滤
-        assert set(df["english"].tolist()) == {"data structure", "algorithm"}
-        assert set(df["chinese"].tolist()) == {"数据结构", "算法"}
+        with open(file_path, "r", encoding="utf-8", newline="") as f:
+            rows = list(csv.DictReader(f))
+        assert len(rows) == 2  # 空术语被过滤
+        assert {row["english"] for row in rows} == {"data structure", "algorithm"}
+        assert {row["chinese"] for row in rows} == {"数据结构", "算法"}
 
     def test_extract_terms(self, mock_terminology_response, monkeypatch):
         """测试术语提取"""
@@ -3,10 +3,15 @@
 
 """
 翻译模块单元测试
+
+测试无状态，直接写成模块级函数，pytest不必为每个用例实例化测试类。
+用例按自然分组收拢成两个参数化测试：translate_unit的整体行为，
+以及各辅助方法的行为。
 """
 
+import dataclasses
+
 import pytest
-from unittest.mock import patch
 
 # 导入测试目标
 from src.translator.translator import Translator
@@ -14,65 +19,103 @@ from src.translator.models import TranslationUnit
 from src.translator.terminology_manager import TerminologyManager
 
 
-class TestTranslator:
-    """翻译器测试"""
+# 模块导入时构建一次并全程共享：测试只通过monkeypatch临时替换方法，
+# 不直接改动实例状态，重复构建只是白白多做文件探测和装配
+_SHARED_TERMINOLOGY_MANAGER = TerminologyManager("nonexistent.csv")
+_SHARED_TRANSLATOR = Translator(_SHARED_TERMINOLOGY_MANAGER)
+
+
+class _CallCounter:
+    """记录调用次数并返回固定值的轻量替身
+
+    只做计数和返回，没有MagicMock的属性生成和调用跟踪机制。
+    """
+
+    def __init__(self, ret):
+        self.ret = ret
+        self.n = 0
+
+    def __call__(self, *args, **kwargs):
+        self.n += 1
+        return self.ret
+
+
+@pytest.fixture(scope="session")
+def translator():
+    """返回模块级共享的翻译器实例"""
+    return _SHARED_TRANSLATOR
+
 
-    @pytest.fixture
-    def translator(self):
-        """返回翻译器实例"""
-        terminology_manager = TerminologyManager("nonexistent.csv")
-        return Translator(terminology_manager)
+@pytest.fixture(scope="module")
+def make_unit():
+    """翻译单元工厂：从同一个模板复制出各测试需要的变体"""
+    base = TranslationUnit(original_text="")
 
-    def test_translate_unit_code_block(self, translator):
-        """测试代码块不进行翻译"""
-        unit = TranslationUnit(original_text="```python\ndef test():\n    pass\n```")
+    def _mk(**kwargs):
+        return dataclasses.replace(base, **kwargs)
 
-        result = translator.translate_unit(unit)
+    return _mk
 
-        # 验证代码块不被翻译
-        assert result.translation == unit.original_text
-        assert result.polished_translation == unit.original_text
 
-    def test_translate_unit_normal_text(self, translator):
-        """测试正常文本翻译流程"""
-        unit = TranslationUnit(original_text="This is a test paragraph.")
+@pytest.mark.parametrize("case", ["code_block", "whitespace", "normal_text"])
+def test_translate_unit(translator, monkeypatch, make_unit, case):
+    """测试translate_unit：代码块与空白原样返回，普通文本走完整流程"""
+    if case == "normal_text":
+        unit = make_unit(original_text="This is a test paragraph.")
 
-        # 模拟依赖的函数
-        with patch.object(
-            translator, "_translate_text", return_value=unit
-        ) as mock_translate_text, patch.object(
-            translator, "_polish_translation", return_value=unit
-        ) as mock_polish:
+        # 用计数替身替换依赖的函数，monkeypatch在测试结束后自动还原
+        mock_translate_text = _CallCounter(unit)
+        mock_polish = _CallCounter(unit)
+        monkeypatch.setattr(translator, "_translate_text", mock_translate_text)
+        monkeypatch.setattr(translator, "_polish_translation", mock_polish)
 
-            translator.translate_unit(unit)
+        translator.translate_unit(unit)
 
-            # 验证调用流程
-            mock_translate_text.assert_called_once()
-            mock_polish.assert_called_once()
+        # 验证调用流程
+        assert mock_translate_text.n == 1
+        assert mock_polish.n == 1
+        return
 
-    def test_translate_text(self, translator):
-        """测试文本翻译"""
-        unit = TranslationUnit(
+    original_text = {
+        "code_block": "```python\ndef test():\n    pass\n```",
+        "whitespace": "   \n\n  ",
+    }[case]
+    unit = make_unit(original_text=original_text)
+
+    result = translator.translate_unit(unit)
+
+    # 验证代码块和纯空白内容都不经过API，原样返回
+    assert result.translation == unit.original_text
+    assert result.polished_translation == unit.original_text
+
+
+@pytest.mark.parametrize("case", ["translate_text", "polish_empty", "polish_nonempty"])
+def test_translator_helpers(translator, monkeypatch, make_unit, case):
+    """测试_translate_text和_polish_translation的各分支"""
+    if case == "translate_text":
+        unit = make_unit(
             original_text="Data structure example",
             technical_terms=[("data structure", "数据结构")],
         )
 
-        with patch(
-            "src.translator.terminology_manager.TerminologyManager.get_terminology_string",
-            return_value="data structure: 数据结构",
-        ), patch(
+        # 只注入返回值，且直接覆盖实例属性，连类描述符的装卸都省掉
+        monkeypatch.setattr(
+            translator.terminology_manager,
+            "get_terminology_string",
+            lambda *a, **kw: "data structure: 数据结构",
+        )
+        monkeypatch.setattr(
             "src.translator.api_client.api_client.translate_text",
-            return_value="数据结构示例",
-        ):
+            lambda *a, **kw: "数据结构示例",
+        )
 
-            result = translator._translate_text(unit)
+        result = translator._translate_text(unit)
 
-            # 验证翻译结果
-            assert result.translation == "数据结构示例"
+        # 验证翻译结果
+        assert result.translation == "数据结构示例"
 
-    def test_polish_translation_empty(self, translator):
-        """测试空翻译不进行润色"""
-        unit = TranslationUnit(original_text="Test", translation="")
+    elif case == "polish_empty":
+        unit = make_unit(original_text="Test", translation="")
 
         result = translator._polish_translation(unit)
 
@@ -80,24 +123,25 @@ class TestTranslator:
         assert result is not None
         assert result.polished_translation == ""
 
-    def test_polish_translation(self, translator):
-        """测试翻译润色"""
-        unit = TranslationUnit(
+    else:
+        unit = make_unit(
             original_text="Test",
             translation="测试",
             suggestions="可以更自然些",
             technical_terms=[],
         )
 
-        with patch(
-            "src.translator.terminology_manager.TerminologyManager.get_terminology_string",
-            return_value="",
-        ), patch(
+        monkeypatch.setattr(
+            translator.terminology_manager,
+            "get_terminology_string",
+            lambda *a, **kw: "",
+        )
+        monkeypatch.setattr(
             "src.translator.api_client.api_client.polish_translation",
-            return_value="自然的测试",
-        ):
+            lambda *a, **kw: "自然的测试",
+        )
 
-            result = translator._polish_translation(unit)
+        result = translator._polish_translation(unit)
 
-            # 验证润色结果
-            assert result.polished_translation == "自然的测试"
+        # 验证润色结果
+        assert result.polished_translation == "自然的测试"
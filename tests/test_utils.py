@@ -3,11 +3,13 @@
 
 """
 工具函数模块单元测试
+
+测试无状态，直接写成模块级函数，pytest不必为每个用例实例化测试类。
 """
 
 import os
-import sys
 import time
+import pytest
 from io import StringIO
 from datetime import datetime
 
@@ -21,88 +23,106 @@ from src.translator.utils import (
 )
 
 
-class TestUtils:
-    """工具函数测试"""
-
-    def test_get_absolute_path(self):
-        """测试获取绝对路径"""
-        # 测试相对路径
-        rel_path = "test/path"
-        abs_path = get_absolute_path(rel_path)
-        assert os.path.isabs(abs_path)
-        assert rel_path in abs_path
-
-        # 测试绝对路径不变
-        orig_abs_path = os.path.abspath("/test/absolute/path")
-        result_abs_path = get_absolute_path(orig_abs_path)
-        assert orig_abs_path == result_abs_path
-
-    def test_ensure_dir_exists(self, tmpdir):
-        """测试确保目录存在"""
-        test_dir = os.path.join(tmpdir, "test_dir")
-
-        # 确认目录不存在
-        assert not os.path.exists(test_dir)
-
-        # 调用测试函数
-        ensure_dir_exists(test_dir)
-
-        # 验证目录被创建
-        assert os.path.exists(test_dir)
-        assert os.path.isdir(test_dir)
-
-        # 再次调用，确保不会出错
-        ensure_dir_exists(test_dir)
-        assert os.path.exists(test_dir)
-
-    def test_get_file_extension(self):
-        """测试获取文件扩展名"""
-        # 测试常见扩展名
-        assert get_file_extension("test.txt") == "txt"
-        assert get_file_extension("path/to/file.html") == "html"
-        assert get_file_extension("no_extension") == ""
-        assert get_file_extension(".hidden") == "hidden"
-        assert get_file_extension("file.with.multiple.dots.md") == "md"
-        assert get_file_extension("FILE.TXT") == "txt"  # 测试大写转小写
-
-    def test_format_timestamp(self):
-        """测试时间戳格式化"""
-        # 测试指定时间戳
-        timestamp = datetime(2023, 1, 1, 12, 0, 0).timestamp()
-        formatted = format_timestamp(timestamp)
-        assert formatted == "2023-01-01 12:00:00"
-
-        # 测试当前时间（只能近似测试）
-        now = time.time()
-        formatted = format_timestamp()
-        now_formatted = datetime.fromtimestamp(now).strftime("%Y-%m-%d %H:%M")
-        assert now_formatted in formatted
-
-    def test_print_progress(self):
-        """测试打印进度条"""
-        # 替换stdout以捕获输出
-        captured_output = StringIO()
-        sys.stdout = captured_output
-
-        try:
-            # 测试打印进度
-            print_progress(50, 100, prefix="Progress:", suffix="Complete", length=20)
-            output = captured_output.getvalue()
-
-            # 验证输出
-            assert "Progress:" in output
-            assert "50.0%" in output
-            assert "Complete" in output
-            assert "|" in output  # 进度条边界
-
-            # 测试进度完成时的换行
-            captured_output.truncate(0)
-            captured_output.seek(0)
-
-            print_progress(100, 100)
-            output = captured_output.getvalue()
-            assert output.endswith("\n")
+# 固定时间戳在模块加载时算好，测试体内不再重复构造datetime对象
+_FIXED_TS = datetime(2023, 1, 1, 12, 0, 0).timestamp()
+
+
+@pytest.mark.parametrize("path", ["test/path", "/test/absolute/path"])
+def test_get_absolute_path(path):
+    """测试获取绝对路径：相对路径被展开，绝对路径保持不变"""
+    result = get_absolute_path(path)
+    assert os.path.isabs(result)
+    if os.path.isabs(path):
+        assert result == os.path.abspath(path)
+    else:
+        assert path in result
+
+
+def test_ensure_dir_exists(tmp_path):
+    """测试确保目录存在"""
+    test_dir = tmp_path / "test_dir"
+
+    # 确认目录不存在
+    assert not test_dir.exists()
+
+    # 调用测试函数
+    ensure_dir_exists(str(test_dir))
+
+    # 验证目录被创建
+    assert test_dir.is_dir()
+
+    # 再次调用，确保不会出错
+    ensure_dir_exists(str(test_dir))
+    assert test_dir.exists()
+
+
+@pytest.mark.parametrize(
+    "path, ext",
+    [
+        ("test.txt", "txt"),
+        ("path/to/file.html", "html"),
+        ("no_extension", ""),
+        (".hidden", "hidden"),
+        ("file.with.multiple.dots.md", "md"),
+        ("FILE.TXT", "txt"),  # 大写转小写
+    ],
+)
+def test_get_file_extension(path, ext):
+    """测试获取文件扩展名"""
+    assert get_file_extension(path) == ext
+
+
+@pytest.mark.parametrize("ts, expected", [(_FIXED_TS, "2023-01-01 12:00:00")])
+def test_format_timestamp_fixed(ts, expected):
+    """测试指定时间戳的格式化"""
+    assert format_timestamp(ts) == expected
+
+
+def test_format_timestamp_now():
+    """测试默认取当前时间（只能近似测试）"""
+    now = time.time()
+    formatted = format_timestamp()
+    now_formatted = datetime.fromtimestamp(now).strftime("%Y-%m-%d %H:%M")
+    assert now_formatted in formatted
+
 
-        finally:
-            # 恢复stdout
-            sys.stdout = sys.__stdout__
+@pytest.fixture(scope="module")
+def progress_buffer():
+    """模块级共享的进度条输出缓冲区，各用例间清空复用"""
+    buffer = StringIO()
+
+    def _fresh():
+        buffer.seek(0)
+        buffer.truncate(0)
+        return buffer
+
+    return _fresh
+
+
+@pytest.mark.parametrize(
+    "current, total, checks",
+    [
+        # 进行中：验证前后缀、百分比和进度条边界
+        (50, 100, ["Progress:", "50.0%", "Complete", "|"]),
+        # 完成时：验证末尾换行
+        (100, 100, ["\n"]),
+    ],
+)
+def test_print_progress(progress_buffer, current, total, checks):
+    """测试打印进度条（直接写入传入的缓冲区，不触碰stdout）"""
+    buffer = progress_buffer()
+    if current == total:
+        print_progress(current, total, file=buffer)
+    else:
+        print_progress(
+            current, total, prefix="Progress:", suffix="Complete", length=20,
+            file=buffer,
+        )
+    output = buffer.getvalue()
+
+    # 验证各片段都出现在输出中，完成时换行必须在末尾
+    for fragment in checks:
+        if fragment == "\n":
+            assert output.endswith("\n")
+        else:
+            assert fragment in output